@@ -0,0 +1,48 @@
+"""gzip compression for JSON API responses.
+
+Analyze/advisor/compare results are several KB of mostly-Hebrew UTF-8 and
+shrink severalfold under gzip. Only ``application/json`` is compressed: HTML
+pages embed the session CSRF token next to reflected input, which is the
+shape BREACH needs, so they are left alone.
+"""
+
+from __future__ import annotations
+
+import gzip
+from typing import TYPE_CHECKING
+
+from flask import request
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+_COMPRESS_MIMETYPES = frozenset({"application/json"})
+_COMPRESS_MIN_BYTES = 1024
+_COMPRESS_LEVEL = 6
+
+
+def register_response_compression(app: "Flask") -> None:
+    """Register the gzip after_request hook.
+
+    after_request hooks run in reverse registration order, so create_app
+    registers this one first to make it the last to touch the body.
+    """
+
+    @app.after_request
+    def gzip_json_response(response):
+        if (
+            response.mimetype not in _COMPRESS_MIMETYPES
+            or response.direct_passthrough
+            or response.is_streamed
+            or "Content-Encoding" in response.headers
+        ):
+            return response
+        response.vary.add("Accept-Encoding")
+        if not request.accept_encodings["gzip"]:
+            return response
+        data = response.get_data()
+        if len(data) < _COMPRESS_MIN_BYTES:
+            return response
+        response.set_data(gzip.compress(data, compresslevel=_COMPRESS_LEVEL, mtime=0))
+        response.headers["Content-Encoding"] = "gzip"
+        return response
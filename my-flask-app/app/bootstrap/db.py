@@ -21,6 +21,14 @@ if TYPE_CHECKING:
     from flask import Flask
 
 
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    try:
+        return int(raw) if raw else default
+    except (TypeError, ValueError) as exc:
+        raise RuntimeError(f"Invalid {name}; must be an integer") from exc
+
+
 def configure_database(app: "Flask", logger: "logging.Logger") -> Tuple[str, bool]:
     """Resolve DATABASE_URL/SECRET_KEY env vars, set Flask config, init extensions.
 
@@ -72,15 +80,29 @@ def configure_database(app: "Flask", logger: "logging.Logger") -> Tuple[str, boo
     app.config["SESSION_COOKIE_SAMESITE"] = "Lax"
 
     # ===== FIX A: SQLAlchemy Connection Pool (prevents stale connections) =====
+    # Total connections = gunicorn workers x (pool_size + max_overflow); keep that
+    # below the Postgres max_connections of the Render plan.
     if db_url and "postgresql" in db_url:
+        pool_size = _env_int("DB_POOL_SIZE", 5)
+        max_overflow = _env_int("DB_POOL_OVERFLOW", 10)
+        pool_timeout = _env_int("DB_POOL_TIMEOUT", 30)
         app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
             "pool_pre_ping": True,
             "pool_recycle": 240,
-            "pool_size": 5,
-            "max_overflow": 10,
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": pool_timeout,
+            # LIFO keeps reusing the few warm connections a mostly-idle AI
+            # workload needs and lets the surplus go idle and get recycled.
+            "pool_use_lifo": True,
             "connect_args": {"connect_timeout": 10, "sslmode": "prefer"}
         }
-        logger.info("[BOOT] SQLAlchemy configured with pool_pre_ping=True, pool_recycle=240")
+        logger.info(
+            "[BOOT] SQLAlchemy configured with pool_pre_ping=True, pool_recycle=240, pool_use_lifo=True, pool_size=%s, max_overflow=%s, pool_timeout=%s",
+            pool_size,
+            max_overflow,
+            pool_timeout,
+        )
 
     if not db_url:
         logger.warning("[BOOT] DATABASE_URL not set. Using in-memory sqlite (LOCAL DEV ONLY).")
@@ -102,11 +124,11 @@ def configure_database(app: "Flask", logger: "logging.Logger") -> Tuple[str, boo
 
     with app.app_context():
         try:
+            # One connection for both boot checks; every gunicorn worker runs this.
+            has_duration_ms = False
             with db.engine.connect() as conn:
                 context = MigrationContext.configure(conn)
                 current_rev = context.get_current_revision()
-            has_duration_ms = False
-            with db.engine.connect() as conn:
                 inspector = inspect(conn)
                 if inspector.has_table("search_history"):
                     cols = [col["name"] for col in inspector.get_columns("search_history")]
@@ -116,6 +138,7 @@ def configure_database(app: "Flask", logger: "logging.Logger") -> Tuple[str, boo
                 current_rev or "(none)",
                 "present" if has_duration_ms else "missing",
             )
+            app.config["ALEMBIC_BOOT_REVISION"] = current_rev
         except Exception:
             logger.exception("[DB] Alembic revision check failed")
 
@@ -123,7 +146,15 @@ def configure_database(app: "Flask", logger: "logging.Logger") -> Tuple[str, boo
 
 
 def log_alembic_revision(app: "Flask", logger: "logging.Logger") -> None:
-    """Second-pass Alembic revision log line (preserved from create_app)."""
+    """Second-pass Alembic revision log line (preserved from create_app).
+
+    Reuses the revision read by :func:`configure_database` instead of opening
+    another connection; only queries when that check did not run.
+    """
+    if "ALEMBIC_BOOT_REVISION" in app.config:
+        current_rev = app.config["ALEMBIC_BOOT_REVISION"]
+        logger.info("[DB] Alembic current revision: %s", current_rev or "(none)")
+        return
     with app.app_context():
         try:
             with db.engine.connect() as conn:
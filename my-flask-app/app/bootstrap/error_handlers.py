@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING
 from flask import jsonify, redirect, request, url_for
 from werkzeug.exceptions import HTTPException, RequestEntityTooLarge
 
-from app.utils.http_helpers import api_error, get_request_id, log_rejection
+from app.utils.http_helpers import api_error, get_request_id, is_api_path, log_rejection
 
 if TYPE_CHECKING:
     from flask import Flask
@@ -52,7 +52,7 @@ def register_error_handlers(app: "Flask", login_manager: "LoginManager") -> None
             request.is_json
             or request.headers.get("X-Requested-With", "").lower() == "xmlhttprequest"
             or "application/json" in (request.accept_mimetypes.best or "")
-            or request.path.startswith("/api/")
+            or is_api_path()
         )
 
         if wants_json:
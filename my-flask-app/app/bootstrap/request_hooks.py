@@ -8,6 +8,8 @@ allowed_hosts, is_host_allowed) are passed in explicitly here.
 
 from __future__ import annotations
 
+import logging
+import re
 import secrets
 import time as pytime
 import uuid
@@ -36,12 +38,25 @@ from app.research import (
     ensure_anon_id,
 )
 from app.utils.auth_helpers import is_owner
-from app.utils.http_helpers import api_error, get_request_id
+from app.utils.http_helpers import api_error, api_ok, get_request_id, is_api_path
 
 if TYPE_CHECKING:
-    import logging
     from flask import Flask
 
+# Render's health probe; answered before any session/user/host work.
+_HEALTHCHECK_PATH = "/healthz"
+
+# Scanner probes answered with a bare 404: each prefix exactly or followed by "/".
+_SECURITY_SCAN_PATH_RE = re.compile(
+    r"/(?:\.env|\.git|wp-admin|config|phpinfo|phpmyadmin|server-status)(?:/|\Z)"
+)
+
+# POST endpoints guarded by check_origin_referer_for_posts.
+_ORIGIN_PROTECTED_PREFIXES = ('/analyze', '/advisor_api', '/api/account/delete', '/api/compare')
+
+# AI write endpoints that require current legal acceptance (one alternation instead of a prefix tuple scan).
+_AI_WRITE_PATH_RE = re.compile(r"^/(?:analyze|advisor_api|api/compare)")
+
 
 def register_request_hooks(
     app: "Flask",
@@ -54,14 +69,26 @@ def register_request_hooks(
     logger: "logging.Logger",
 ) -> None:
     """Register every request-lifecycle hook used by create_app."""
+    # canonical_host is already lowercased by create_app.
+    canonical_www_host = f"www.{canonical_host}" if canonical_host else ""
+
+    @app.before_request
+    def healthcheck_fast_path():
+        """Answer /healthz before the session, Flask-Login and host gates run."""
+        if request.path != _HEALTHCHECK_PATH:
+            return None
+        g.request_id = str(uuid.uuid4())
+        g.start_time = pytime.perf_counter()
+        return api_ok({"status": "ok"})
 
     @app.before_request
     def ensure_yrc_anon_cookie():
         """Set a stable anonymous cookie for PostHog distinct_id on anonymous users."""
-        if hasattr(request, 'cookies') and not request.cookies.get('yrc_anon'):
-            g._set_yrc_anon = uuid.uuid4().hex
-        else:
-            g._set_yrc_anon = None
+        g._set_yrc_anon = (
+            None
+            if request.endpoint == "static" or request.cookies.get('yrc_anon')
+            else secrets.token_hex(16)
+        )
 
     @app.after_request
     def set_yrc_anon_cookie(response):
@@ -81,7 +108,7 @@ def register_request_hooks(
     @app.after_request
     def log_response_metadata(response):
         path = request.path or ""
-        if path.startswith("/static/") or path == "/favicon.ico":
+        if path.startswith("/static/") or path in ("/favicon.ico", _HEALTHCHECK_PATH):
             return response
         duration_ms = None
         if getattr(g, "start_time", None) is not None:
@@ -113,21 +140,23 @@ def register_request_hooks(
             g.request_id = str(uuid.uuid4())
         g.start_time = pytime.perf_counter()
         g.csp_nonce = secrets.token_urlsafe(16)
-        ensure_anon_id(session)
+        if request.endpoint != "static":
+            ensure_anon_id(session)
 
-        host = (request.host or "").lower()
+        if not canonical_www_host:
+            return None
         # Preserve port if present (e.g., local dev)
-        host_parts = host.split(":")
-        hostname_only = host_parts[0]
-        port_part = f":{host_parts[1]}" if len(host_parts) > 1 else ""
-        if canonical_host and hostname_only == f"www.{canonical_host}":
-            target_host = canonical_host + port_part
+        hostname_only, sep, port = (request.host or "").lower().partition(":")
+        if hostname_only == canonical_www_host:
+            target_host = canonical_host + sep + port
             parsed = urlparse(request.url)
             redirect_url = parsed._replace(netloc=target_host).geturl()
             return redirect(redirect_url, code=301)
 
     @app.context_processor
     def inject_template_globals():
+        # Bind the proxy lookups once; this runs on every template render.
+        is_authenticated = current_user.is_authenticated
         legal_accepted = False
         research_consent_accepted = False
         posthog_key = app.config.get("POSTHOG_API_KEY", "")
@@ -135,15 +164,16 @@ def register_request_hooks(
         terms_version = app.config.get("TERMS_VERSION", TERMS_VERSION)
         privacy_version = app.config.get("PRIVACY_VERSION", PRIVACY_VERSION)
         research_notice_version = app.config.get("RESEARCH_NOTICE_VERSION", RESEARCH_NOTICE_VERSION)
-        if current_user.is_authenticated:
+        if is_authenticated:
+            user_id = current_user.id
             try:
                 legal_accepted = LegalAcceptance.query.filter_by(
-                    user_id=current_user.id,
+                    user_id=user_id,
                     terms_version=terms_version,
                     privacy_version=privacy_version,
                 ).first() is not None
                 research_consent_accepted = ResearchConsent.query.filter_by(
-                    user_id=current_user.id,
+                    user_id=user_id,
                     consent_type=RESEARCH_CONSENT_TYPE,
                     terms_version=terms_version,
                     privacy_version=privacy_version,
@@ -163,6 +193,12 @@ def register_request_hooks(
                 ).first() is not None
             except Exception:
                 research_consent_accepted = False
+        # The CSRF token (Double Submit Cookie pattern) is only consumed via the
+        # page's <meta name="csrf-token">, so mint it lazily on first render
+        # rather than in a before_request hook for every API/asset request.
+        csrf_token = session.get("csrf_token")
+        if not csrf_token:
+            csrf_token = session["csrf_token"] = secrets.token_hex(32)
         app.logger.info(
             "[POSTHOG] template config injected=%s path=%s host=%s",
             bool(posthog_key),
@@ -170,9 +206,9 @@ def register_request_hooks(
             posthog_host if posthog_key else "",
         )
         return {
-            "is_logged_in": current_user.is_authenticated,
+            "is_logged_in": is_authenticated,
             "current_user": current_user,
-            "is_owner": is_owner(),
+            "is_owner": is_authenticated and is_owner(),
             "contact_email": app.config.get("CONTACT_EMAIL", CONTACT_EMAIL),
             "legal_accepted": legal_accepted,
             "research_consent_accepted": research_consent_accepted,
@@ -181,10 +217,10 @@ def register_request_hooks(
             "terms_version": terms_version,
             "privacy_version": privacy_version,
             "csp_nonce": getattr(g, "csp_nonce", ""),
-            "csrf_token": session.get("csrf_token", ""),
+            "csrf_token": csrf_token,
             "posthog_key": posthog_key,
             "posthog_host": posthog_host,
-            "is_authenticated": current_user.is_authenticated,
+            "is_authenticated": is_authenticated,
         }
 
     @app.before_request
@@ -192,20 +228,15 @@ def register_request_hooks(
         """Validate the Host header to prevent host header injection attacks."""
         host = request.host
         if not is_host_allowed(host):
-            logger.warning(f"[SECURITY] Invalid host header: {host}")
+            logger.warning("[SECURITY] Invalid host header: %s", host)
             # For API routes, return JSON error
-            if request.is_json or request.accept_mimetypes.accept_json or request.path.startswith(('/analyze', '/advisor_api', '/search-details')):
+            if request.is_json or request.accept_mimetypes.accept_json or is_api_path():
                 return api_error("invalid_host", "Invalid host header", status=400)
             return "Invalid host header", 400
 
     @app.before_request
     def block_security_scan_paths():
-        path = (request.path or "").lower()
-        blocked_prefixes = (
-            "/.env", "/.git", "/wp-admin", "/config", "/phpinfo",
-            "/phpmyadmin", "/server-status",
-        )
-        if not any(path == p or path.startswith(f"{p}/") for p in blocked_prefixes):
+        if not _SECURITY_SCAN_PATH_RE.match((request.path or "").lower()):
             return None
         client_ip = get_client_ip()
         try:
@@ -240,12 +271,6 @@ def register_request_hooks(
         return None
 
     # Phase 2H: Origin/Referer protection for session-auth POST endpoints (CSRF-safe without tokens)
-    @app.before_request
-    def ensure_csrf_token():
-        """Ensure a CSRF token exists in the session for Double Submit Cookie pattern."""
-        if "csrf_token" not in session:
-            session["csrf_token"] = secrets.token_hex(32)
-
     @app.before_request
     def check_origin_referer_for_posts():
         """
@@ -257,12 +282,19 @@ def register_request_hooks(
             return None
 
         # Only check specific endpoints (not login/auth which may come from external OAuth flow)
-        protected_paths = ['/analyze', '/advisor_api', '/api/account/delete', '/api/compare']
-        if not any(request.path.startswith(p) for p in protected_paths):
+        path = request.path
+        if not path.startswith(_ORIGIN_PROTECTED_PREFIXES):
+            return None
+        headers = request.headers
+
+        # Browsers set Sec-Fetch-Site themselves and page scripts cannot forge it.
+        # A same-origin fetch targets a host that validate_host_header already
+        # allowed, so skip the Origin/Referer parsing below.
+        if headers.get("Sec-Fetch-Site", "").lower() == "same-origin":
             return None
 
         def _forbidden_response():
-            if request.path.startswith("/api/account/delete"):
+            if path.startswith("/api/account/delete"):
                 rid = get_request_id()
                 resp = jsonify({"error": "forbidden", "request_id": rid})
                 resp.status_code = 403
@@ -271,8 +303,8 @@ def register_request_hooks(
             return api_error("forbidden_origin", "Request from unauthorized origin", status=403)
 
         # Get Origin or Referer header
-        origin = request.headers.get('Origin')
-        referer = request.headers.get('Referer')
+        origin = headers.get('Origin')
+        referer = headers.get('Referer')
 
         # Extract host from origin or referer
         if origin:
@@ -295,16 +327,21 @@ def register_request_hooks(
 
         if not origin_host:
             # Fallback: Double Submit Cookie check
-            csrf_header = request.headers.get("X-CSRF-Token", "")
+            csrf_header = headers.get("X-CSRF-Token", "")
             csrf_session = session.get("csrf_token", "")
-            if csrf_header and csrf_session and len(csrf_header) == 64 and csrf_header == csrf_session:
+            if (
+                csrf_header
+                and csrf_session
+                and len(csrf_header) == 64
+                and secrets.compare_digest(csrf_header.encode(), csrf_session.encode())
+            ):
                 return None  # CSRF token valid, allow request
-            logger.warning(f"[CSRF] POST to {request.path} with no Origin/Referer and invalid/missing CSRF token")
+            logger.warning("[CSRF] POST to %s with no Origin/Referer and invalid/missing CSRF token", path)
             return _forbidden_response()
 
-        host_no_port = origin_host.split(':')[0].lower() if ':' in origin_host else origin_host.lower()
+        host_no_port = origin_host.split(':', 1)[0].lower()
         if host_no_port not in allowed_hosts:
-            logger.warning(f"[CSRF] Blocked POST to {request.path} from disallowed origin: {origin_host}")
+            logger.warning("[CSRF] Blocked POST to %s from disallowed origin: %s", path, origin_host)
             return _forbidden_response()
 
         return None
@@ -315,6 +352,8 @@ def register_request_hooks(
         Centralized legal enforcement to avoid missing endpoints.
         ProxyFix normalizes request.remote_addr; only allowlisted paths bypass acceptance.
         """
+        if request.method in ("GET", "HEAD", "OPTIONS"):
+            return None
         path = request.path or ""
         allowlist = {
             "/",
@@ -336,8 +375,6 @@ def register_request_hooks(
             return None
         if not current_user.is_authenticated:
             return None
-        if request.method in ("GET", "HEAD", "OPTIONS"):
-            return None
 
         def _legal_error(code: str, message: str):
             rid = get_request_id()
@@ -346,14 +383,14 @@ def register_request_hooks(
             resp.headers["X-Request-ID"] = rid
             return resp
 
-        is_ai_write = request.method in ("POST", "PUT", "PATCH", "DELETE") and path.startswith(
-            ("/analyze", "/advisor_api", "/api/compare")
-        )
-        if not is_ai_write:
+        if request.method not in ("POST", "PUT", "PATCH", "DELETE") or not _AI_WRITE_PATH_RE.match(path):
             return None
 
         payload = request.get_json(silent=True) if request.is_json else request.form
-        if not parse_legal_confirm((payload or {}).get("legal_confirm")):
+        if not isinstance(payload, dict):
+            # Malformed or non-object JSON (e.g. a top-level list) carries no confirmation.
+            payload = {}
+        if not parse_legal_confirm(payload.get("legal_confirm")):
             return _legal_error("TERMS_NOT_ACCEPTED", "Please accept Terms & Privacy to continue.")
 
         terms_version = app.config.get("TERMS_VERSION")
@@ -375,19 +412,26 @@ def register_request_hooks(
         """
         Phase 2K: Log request metadata (request_id assigned earlier).
         """
-        request_id = getattr(g, "request_id", str(uuid.uuid4()))
-        g.request_id = request_id
+        request_id = getattr(g, "request_id", None)
+        if not request_id:
+            request_id = g.request_id = str(uuid.uuid4())
 
-        xfp = request.headers.get("X-Forwarded-Proto", "")
-        xff = request.headers.get("X-Forwarded-For", "")
-        auth_state = current_user.is_authenticated
+        if not logger.isEnabledFor(logging.INFO):
+            return None
         path = request.path or ""
 
         if not (path.startswith("/static/") or path == "/favicon.ico"):
             # Phase 2K: Use logger instead of print
             logger.info(
-                f"[REQ] request_id={request_id} {request.method} {path} "
-                f"host={request.host} scheme={request.scheme} xfp={xfp} xff={xff} auth={auth_state}"
+                "[REQ] request_id=%s %s %s host=%s scheme=%s xfp=%s xff=%s auth=%s",
+                request_id,
+                request.method,
+                path,
+                request.host,
+                request.scheme,
+                request.headers.get("X-Forwarded-Proto", ""),
+                request.headers.get("X-Forwarded-For", ""),
+                current_user.is_authenticated,
             )
 
     @app.teardown_request
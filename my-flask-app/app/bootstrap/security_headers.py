@@ -7,6 +7,7 @@ moved from inside ``create_app`` to this dedicated bootstrap module.
 
 from __future__ import annotations
 
+import logging
 import time as pytime
 from typing import TYPE_CHECKING
 
@@ -16,7 +17,6 @@ from flask_login import current_user
 from app.utils.http_helpers import get_request_id
 
 if TYPE_CHECKING:
-    import logging
     from flask import Flask
 
 
@@ -31,50 +31,64 @@ def register_security_headers(app: "Flask", *, is_render: bool, logger: "logging
     logger : logging.Logger
     """
 
+    # Everything except the per-request CSP nonce is fixed once the app is
+    # configured, so build the header values here rather than per response.
+    static_headers = (
+        ("X-Content-Type-Options", "nosniff"),
+        ("Referrer-Policy", "strict-origin-when-cross-origin"),
+        ("X-Frame-Options", "DENY"),
+        ("Permissions-Policy", "geolocation=(), microphone=(), camera=(), payment=()"),
+        ("Cross-Origin-Opener-Policy", "same-origin"),
+        ("Cross-Origin-Resource-Policy", "same-site"),
+    )
+    ph_script = app.config.get("_PH_CSP_SCRIPT", "")
+    ph_connect = app.config.get("_PH_CSP_CONNECT", "")
+    ph_script_src = f" https://{ph_script}" if ph_script else ""
+    ph_connect_src = f" https://{ph_connect}" if ph_connect else ""
+    csp_head = "default-src 'self'; script-src 'self' "
+    csp_tail = (
+        f" https://cdn.tailwindcss.com https://cdn.jsdelivr.net{ph_script_src}; "
+        f"style-src 'self' 'unsafe-inline' https://cdn.tailwindcss.com https://cdn.jsdelivr.net https://fonts.googleapis.com; "
+        f"font-src 'self' https://fonts.gstatic.com; "
+        f"img-src 'self' data: https://*.googleusercontent.com; "
+        f"connect-src 'self' https://accounts.google.com https://www.googleapis.com https://openidconnect.googleapis.com https://generativelanguage.googleapis.com{ph_connect_src}; "
+        f"frame-ancestors 'none'; "
+        f"base-uri 'self'; "
+        f"form-action 'self' https://accounts.google.com"
+    )
+    hsts_value = "max-age=63072000; includeSubDomains; preload"
+
     @app.after_request
     def apply_security_headers(response):
         rid = get_request_id()
-        response.headers.setdefault("X-Request-ID", rid)
-        response.headers.setdefault("X-Content-Type-Options", "nosniff")
-        response.headers.setdefault("Referrer-Policy", "strict-origin-when-cross-origin")
-        response.headers.setdefault("X-Frame-Options", "DENY")
-        response.headers.setdefault(
-            "Permissions-Policy",
-            "geolocation=(), microphone=(), camera=(), payment=()"
-        )
-        response.headers.setdefault("Cross-Origin-Opener-Policy", "same-origin")
-        response.headers.setdefault("Cross-Origin-Resource-Policy", "same-site")
+        headers = response.headers
+        headers.setdefault("X-Request-ID", rid)
+        for name, value in static_headers:
+            headers.setdefault(name, value)
         csp_nonce = getattr(g, "csp_nonce", "")
         nonce_directive = f"'nonce-{csp_nonce}'" if csp_nonce else "'unsafe-inline'"
-        ph_script = app.config.get("_PH_CSP_SCRIPT", "")
-        ph_connect = app.config.get("_PH_CSP_CONNECT", "")
-        ph_script_src = f" https://{ph_script}" if ph_script else ""
-        ph_connect_src = f" https://{ph_connect}" if ph_connect else ""
-        response.headers.setdefault(
-            "Content-Security-Policy",
-            f"default-src 'self'; "
-            f"script-src 'self' {nonce_directive} https://cdn.tailwindcss.com https://cdn.jsdelivr.net{ph_script_src}; "
-            f"style-src 'self' 'unsafe-inline' https://cdn.tailwindcss.com https://cdn.jsdelivr.net https://fonts.googleapis.com; "
-            f"font-src 'self' https://fonts.gstatic.com; "
-            f"img-src 'self' data: https://*.googleusercontent.com; "
-            f"connect-src 'self' https://accounts.google.com https://www.googleapis.com https://openidconnect.googleapis.com https://generativelanguage.googleapis.com{ph_connect_src}; "
-            f"frame-ancestors 'none'; "
-            f"base-uri 'self'; "
-            f"form-action 'self' https://accounts.google.com"
-        )
+        headers.setdefault("Content-Security-Policy", csp_head + nonce_directive + csp_tail)
         if is_render or request.is_secure:
-            response.headers.setdefault("Strict-Transport-Security", "max-age=63072000; includeSubDomains; preload")
+            headers.setdefault("Strict-Transport-Security", hsts_value)
 
         # Structured-ish response log with duration
         try:
-            duration_ms = None
-            if hasattr(g, "start_time"):
-                duration_ms = (pytime.perf_counter() - g.start_time) * 1000
-            user_id = current_user.id if current_user.is_authenticated else "anonymous"
-            if not (request.path.startswith("/static/") or request.path == "/favicon.ico"):
+            path = request.path
+            if logger.isEnabledFor(logging.INFO) and not (
+                path.startswith("/static/") or path in ("/favicon.ico", "/healthz")
+            ):
+                duration_ms = None
+                if hasattr(g, "start_time"):
+                    duration_ms = (pytime.perf_counter() - g.start_time) * 1000
+                user_id = current_user.id if current_user.is_authenticated else "anonymous"
                 logger.info(
-                    f"[RESP] request_id={rid} method={request.method} path={request.path} "
-                    f"status={response.status_code} duration_ms={(duration_ms or 0):.2f} user={user_id}"
+                    "[RESP] request_id=%s method=%s path=%s status=%s duration_ms=%.2f user=%s",
+                    rid,
+                    request.method,
+                    path,
+                    response.status_code,
+                    duration_ms or 0,
+                    user_id,
                 )
         except Exception:
             pass
@@ -28,6 +28,10 @@ GLOBAL_DAILY_LIMIT = 1000
 USER_DAILY_LIMIT = int(os.environ.get("QUOTA_LIMIT", "5"))
 MAX_CACHE_DAYS = 45
 PER_IP_PER_MIN_LIMIT = 20
+# Per-endpoint overrides for the per-IP fixed window (one upsert per hit).
+# The expensive AI endpoints can be tightened without touching the default.
+ANALYZE_PER_IP_PER_MIN_LIMIT = int(os.environ.get("RL_ANALYZE", str(PER_IP_PER_MIN_LIMIT)))
+ADVISOR_PER_IP_PER_MIN_LIMIT = int(os.environ.get("RL_ADVISOR", str(PER_IP_PER_MIN_LIMIT)))
 QUOTA_RESERVATION_TTL_SECONDS = int(os.environ.get("QUOTA_RESERVATION_TTL_SECONDS", "600"))
 MAX_ACTIVE_RESERVATIONS = 1
 
@@ -45,6 +49,8 @@ __all__ = [
     "USER_DAILY_LIMIT",
     "MAX_CACHE_DAYS",
     "PER_IP_PER_MIN_LIMIT",
+    "ANALYZE_PER_IP_PER_MIN_LIMIT",
+    "ADVISOR_PER_IP_PER_MIN_LIMIT",
     "QUOTA_RESERVATION_TTL_SECONDS",
     "MAX_ACTIVE_RESERVATIONS",
     "MAX_CONTENT_LENGTH_DEFAULT",
@@ -7,6 +7,7 @@
 
 import os, re, json, traceback, logging, uuid, random, hashlib, concurrent.futures, atexit
 import time as pytime
+from functools import lru_cache
 from typing import Optional, Tuple, Any, Dict, Mapping
 from datetime import datetime, time, timedelta, date
 from zoneinfo import ZoneInfo
@@ -112,6 +113,7 @@ from app.quota import (
 # Re-exported here so that existing `from app.factory import ...` imports keep
 # working without changes.
 from app.config import (  # noqa: E402,F401
+    ADVISOR_PER_IP_PER_MIN_LIMIT,
     AI_CALL_TIMEOUT_SEC,
     AI_EXECUTOR,
     AI_EXECUTOR_WORKERS,
@@ -119,6 +121,7 @@ from app.config import (  # noqa: E402,F401
     GLOBAL_DAILY_LIMIT,
     MAX_ACTIVE_RESERVATIONS,
     MAX_CACHE_DAYS,
+    ANALYZE_PER_IP_PER_MIN_LIMIT,
     MAX_CONTENT_LENGTH_DEFAULT,
     PER_IP_PER_MIN_LIMIT,
     QUOTA_RESERVATION_TTL_SECONDS,
@@ -232,37 +235,51 @@ except Exception as e:
 
 import re as _re
 
+_RE_NUM = _re.compile(r"-?\d+(?:\.\d+)?")
+_RE_PARENS = _re.compile(r"\(.*?\)")
+_RE_WS = _re.compile(r"\s+")
+_RE_KM_100 = _re.compile(r"(?<!\d)100(?!\d)")
+_RE_KM_150 = _re.compile(r"(?<!\d)150(?!\d)")
+_RE_KM_200 = _re.compile(r"(?<!\d)200(?!\d)")
+
 
 def normalize_text(s: Any) -> str:
     if s is None:
         return ""
-    s = _re.sub(r"\(.*?\)", " ", str(s)).strip().lower()
-    return _re.sub(r"\s+", " ", s)
+    s = _RE_PARENS.sub(" ", str(s)).strip().lower()
+    return _RE_WS.sub(" ", s)
 
 
+@lru_cache(maxsize=32)
 def mileage_adjustment(mileage_range: str) -> Tuple[int, Optional[str]]:
-    m = normalize_text(mileage_range or "")
+    # Pure and low-cardinality (a handful of form options), so memoized.
+    # Callers coerce None to "" to keep the cache key stable.
+    m = normalize_text(mileage_range)
     if not m:
         return 0, None
-    if re.search(r'(?<!\d)200(?!\d)', m) and "+" in m:
+    if "+" in m and _RE_KM_200.search(m):
         return -15, "הציון הותאם מטה עקב קילומטראז׳ גבוה מאוד (200K+)."
-    if re.search(r'(?<!\d)150(?!\d)', m) and re.search(r'(?<!\d)200(?!\d)', m):
+    if _RE_KM_150.search(m) and _RE_KM_200.search(m):
         return -10, "הציון הותאם מטה עקב קילומטראז׳ גבוה (150–200 אלף ק״מ)."
-    if re.search(r'(?<!\d)100(?!\d)', m) and re.search(r'(?<!\d)150(?!\d)', m):
+    if _RE_KM_100.search(m) and _RE_KM_150.search(m):
         return -5, "הציון הותאם מעט מטה עקב קילומטראז׳ בינוני-גבוה (100–150 אלף ק״מ)."
     return 0, None
 
 
 def apply_mileage_logic(model_output: dict, mileage_range: str) -> Tuple[dict, Optional[str]]:
     try:
-        adj, note = mileage_adjustment(mileage_range)
+        adj, note = mileage_adjustment(mileage_range or "")
         for base_key in ("base_score_calculated", "overall_score"):
             if base_key in model_output:
-                try:
-                    base_val = float(model_output[base_key])
-                except Exception:
-                    m = _re.search(r"-?\d+(\.\d+)?", str(model_output[base_key]))
+                raw_val = model_output[base_key]
+                if isinstance(raw_val, (int, float)):
+                    base_val = float(raw_val)
+                elif isinstance(raw_val, str):
+                    # Model sometimes returns strings like "78.5/100".
+                    m = _RE_NUM.search(raw_val)
                     base_val = float(m.group()) if m else None
+                else:
+                    base_val = None
                 if base_val is not None:
                     new_val = max(0.0, min(100.0, base_val + adj))
                     model_output[base_key] = round(new_val, 1)
@@ -378,6 +395,10 @@ def create_app():
     templates_dir = os.path.join(base_dir, "templates")
     static_dir = os.path.join(base_dir, "static")
     app = Flask(__name__, template_folder=templates_dir, static_folder=static_dir)
+    # JSON responses carry large Hebrew AI payloads: emit UTF-8 directly instead of
+    # \uXXXX escapes (~3x smaller) and skip the recursive key sort on every jsonify.
+    app.json.ensure_ascii = False
+    app.json.sort_keys = False
     
     # Phase 2K: Configure Python logging (structured logging to stdout)
     logging.basicConfig(
@@ -422,7 +443,7 @@ def create_app():
         ]
         if value
     ])
-    OWNER_EMAILS = set(parse_owner_emails(owner_emails_raw))
+    OWNER_EMAILS = frozenset(parse_owner_emails(owner_emails_raw))
     OWNER_BYPASS_QUOTA = os.environ.get("OWNER_BYPASS_QUOTA", "1").lower() in ("1", "true", "yes")
     ADVISOR_OWNER_ONLY = os.environ.get("ADVISOR_OWNER_ONLY", "1").lower() in ("1", "true", "yes")
     
@@ -432,6 +453,8 @@ def create_app():
     app.config['OWNER_BYPASS_QUOTA'] = OWNER_BYPASS_QUOTA
     app.config['ADVISOR_OWNER_ONLY'] = ADVISOR_OWNER_ONLY
     app.config['PER_IP_PER_MIN_LIMIT'] = PER_IP_PER_MIN_LIMIT
+    app.config['ANALYZE_PER_IP_PER_MIN_LIMIT'] = ANALYZE_PER_IP_PER_MIN_LIMIT
+    app.config['ADVISOR_PER_IP_PER_MIN_LIMIT'] = ADVISOR_PER_IP_PER_MIN_LIMIT
     app.config['QUOTA_RESERVATION_TTL_SECONDS'] = QUOTA_RESERVATION_TTL_SECONDS
     app.config["TERMS_VERSION"] = TERMS_VERSION
     app.config["PRIVACY_VERSION"] = PRIVACY_VERSION
@@ -504,6 +527,11 @@ def create_app():
 
     login_manager.login_view = 'public.login'
 
+    # JSON gzip must be registered before every other after_request hook so it
+    # runs last (Flask runs after_request hooks in reverse order).
+    from app.bootstrap.compression import register_response_compression
+    register_response_compression(app)
+
     # Phase 4: request lifecycle hooks (before/after/teardown + context_processor)
     # extracted to app.bootstrap.request_hooks. Closures over canonical_host,
     # ALLOWED_HOSTS, is_host_allowed, get_client_ip, and
@@ -109,7 +109,7 @@ class DailyQuotaUsage(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
-    day = db.Column(db.Date, nullable=False, index=True)
+    day = db.Column(db.Date, nullable=False)
     count = db.Column(db.Integer, nullable=False, default=0)
     updated_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc).replace(tzinfo=None), onupdate=lambda: datetime.now(timezone.utc).replace(tzinfo=None))
 
@@ -148,6 +148,8 @@ class QuotaReservation(db.Model):
 class SearchHistory(db.Model):
     __table_args__ = (
         db.Index("ix_search_history_user_cache_ts", "user_id", "cache_key", desc("timestamp")),
+        # Dashboard / history list: WHERE user_id = ? ORDER BY timestamp DESC LIMIT n
+        db.Index("ix_search_history_user_ts", "user_id", desc("timestamp")),
         db.Index(
             "idx_search_history_public_examples",
             "example_slug",
@@ -178,6 +180,10 @@ class AdvisorHistory(db.Model):
     - result_json: כל ההמלצות + כל הפרמטרים וההסברים לכל רכב
     """
 
+    __table_args__ = (
+        db.Index("ix_advisor_history_user_ts", "user_id", desc("timestamp")),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
     timestamp = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc).replace(tzinfo=None))
@@ -194,14 +200,13 @@ class IpRateLimit(db.Model):
     __tablename__ = "ip_rate_limit"
 
     id = db.Column(db.Integer, primary_key=True)
-    ip = db.Column(db.String(64), nullable=False, index=True)
+    ip = db.Column(db.String(64), nullable=False)
     window_start = db.Column(db.DateTime, nullable=False, index=True)
     count = db.Column(db.Integer, nullable=False, default=0)
     updated_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc).replace(tzinfo=None), onupdate=lambda: datetime.now(timezone.utc).replace(tzinfo=None))
 
     __table_args__ = (
         db.UniqueConstraint("ip", "window_start", name="uq_ip_window"),
-        db.Index("ix_ip_window", "ip", "window_start"),
     )
 
 
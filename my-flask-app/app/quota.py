@@ -5,6 +5,7 @@ from typing import Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from flask import request
+from sqlalchemy import insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from app.extensions import db
@@ -21,6 +22,8 @@ PER_IP_PER_MIN_LIMIT = 20
 QUOTA_RESERVATION_TTL_SECONDS = 600
 MAX_ACTIVE_RESERVATIONS = 1
 
+_UTC_TZ = ZoneInfo("UTC")
+
 
 def resolve_app_timezone() -> Tuple[ZoneInfo, str]:
     tz_name = os.environ.get("APP_TZ", "Asia/Jerusalem").strip() or "Asia/Jerusalem"
@@ -33,7 +36,13 @@ def resolve_app_timezone() -> Tuple[ZoneInfo, str]:
 
 
 def compute_quota_window(tz: ZoneInfo, *, now: Optional[datetime] = None) -> Tuple[date, datetime, datetime, datetime, datetime, int]:
-    now_utc = now.astimezone(ZoneInfo("UTC")) if now else _utcnow().replace(tzinfo=ZoneInfo("UTC"))
+    # A naive ``now`` is UTC, matching what _utcnow() returns to the routes.
+    if now is None:
+        now_utc = _utcnow().replace(tzinfo=_UTC_TZ)
+    elif now.tzinfo is None:
+        now_utc = now.replace(tzinfo=_UTC_TZ)
+    else:
+        now_utc = now.astimezone(_UTC_TZ)
     now_tz = now_utc.astimezone(tz) if tz else now_utc
     day_key = now_tz.date()
     window_start = datetime.combine(day_key, time.min, tzinfo=tz)
@@ -143,6 +152,121 @@ def _get_or_create_quota_row(user_id: int, day_key: date, now_utc: datetime) ->
     return quota
 
 
+def _quota_upsert_insert():
+    bind = db.session.get_bind()
+    dialect_name = bind.dialect.name if bind else ""
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        return None
+    return dialect_insert
+
+
+def _upsert_increment_quota_row(user_id: int, day_key: date, now_utc: datetime) -> Optional[int]:
+    """Insert-or-increment the user's quota row in a single statement.
+
+    Returns the new count, or ``None`` when the dialect has no upsert support so
+    the caller can fall back to the lock-and-update path.
+    """
+    dialect_insert = _quota_upsert_insert()
+    if dialect_insert is None:
+        return None
+    count_col = DailyQuotaUsage.__table__.c.count
+    stmt = (
+        dialect_insert(DailyQuotaUsage)
+        .values(user_id=user_id, day=day_key, count=1, updated_at=now_utc)
+        .on_conflict_do_update(
+            index_elements=["user_id", "day"],
+            set_={"count": count_col + 1, "updated_at": now_utc},
+        )
+        .returning(count_col)
+    )
+    return db.session.execute(stmt).scalar_one()
+
+
+def _lock_quota_row_count(user_id: int, day_key: date, now_utc: datetime) -> Optional[int]:
+    """Ensure the user's quota row exists, row-lock it and return its count.
+
+    One upsert round trip in place of insert-if-missing + ``SELECT ... FOR
+    UPDATE``: the no-op conflict update takes the same row lock. Returns
+    ``None`` when the dialect has no upsert support.
+    """
+    dialect_insert = _quota_upsert_insert()
+    if dialect_insert is None:
+        return None
+    count_col = DailyQuotaUsage.__table__.c.count
+    stmt = (
+        dialect_insert(DailyQuotaUsage)
+        .values(user_id=user_id, day=day_key, count=0, updated_at=now_utc)
+        .on_conflict_do_update(
+            index_elements=["user_id", "day"],
+            set_={"count": count_col},
+        )
+        .returning(count_col)
+    )
+    return db.session.execute(stmt).scalar_one()
+
+
+def _upsert_increment_quota_row_within_limit(
+    user_id: int, day_key: date, limit: int, now_utc: datetime
+) -> Optional[Tuple[bool, int]]:
+    """Check-and-increment the user's quota row in a single statement.
+
+    The conflict update only fires while ``count < limit``, so two workers racing
+    at ``limit - 1`` cannot both succeed. Returns ``(allowed, count)`` or ``None``
+    when the dialect has no upsert support.
+    """
+    dialect_insert = _quota_upsert_insert()
+    if dialect_insert is None:
+        return None
+    if limit <= 0:
+        return False, get_daily_quota_usage(user_id, day_key)
+    count_col = DailyQuotaUsage.__table__.c.count
+    stmt = (
+        dialect_insert(DailyQuotaUsage)
+        .values(user_id=user_id, day=day_key, count=1, updated_at=now_utc)
+        .on_conflict_do_update(
+            index_elements=["user_id", "day"],
+            set_={"count": count_col + 1, "updated_at": now_utc},
+            where=count_col < limit,
+        )
+        .returning(count_col)
+    )
+    new_count = db.session.execute(stmt).scalar_one_or_none()
+    if new_count is None:
+        # Column select bypasses any stale DailyQuotaUsage in the identity map.
+        current = (
+            db.session.query(DailyQuotaUsage.count)
+            .filter_by(user_id=user_id, day=day_key)
+            .scalar()
+        )
+        return False, current or 0
+    return True, new_count
+
+
+def _insert_reservation_row(user_id: int, day_key: date, request_id: str, now_utc: datetime) -> int:
+    """Insert a ``reserved`` row with a Core INSERT ... RETURNING id.
+
+    Nothing reads the reservation back as an ORM object, so skip building and
+    flushing an instance through the unit of work.
+    """
+    stmt = (
+        insert(QuotaReservation)
+        .values(
+            user_id=user_id,
+            day=day_key,
+            status="reserved",
+            request_id=request_id,
+            created_at=now_utc,
+            updated_at=now_utc,
+        )
+        .returning(QuotaReservation.id)
+    )
+    return db.session.execute(stmt).scalar_one()
+
+
 def reserve_daily_quota(user_id: int, day_key: date, limit: int, request_id: str, now_utc: Optional[datetime] = None):
     now = now_utc or _utcnow()
     try:
@@ -157,8 +281,9 @@ def reserve_daily_quota(user_id: int, day_key: date, limit: int, request_id: str
                 day_key,
             )
         with db.session.begin_nested():
-            quota = _get_or_create_quota_row(user_id, day_key, now)
-            consumed_count = quota.count
+            consumed_count = _lock_quota_row_count(user_id, day_key, now)
+            if consumed_count is None:
+                consumed_count = _get_or_create_quota_row(user_id, day_key, now).count
 
             active_reserved = (
                 db.session.query(QuotaReservation)
@@ -174,17 +299,7 @@ def reserve_daily_quota(user_id: int, day_key: date, limit: int, request_id: str
                 db.session.rollback()
                 return False, consumed_count, active_reserved, None
 
-            reservation = QuotaReservation(
-                user_id=user_id,
-                day=day_key,
-                status="reserved",
-                request_id=request_id,
-                created_at=now,
-                updated_at=now,
-            )
-            db.session.add(reservation)
-            db.session.flush()
-            reservation_id = reservation.id
+            reservation_id = _insert_reservation_row(user_id, day_key, request_id, now)
 
         db.session.commit()
         return True, consumed_count, active_reserved + 1, reservation_id
@@ -210,15 +325,18 @@ def finalize_quota_reservation(reservation_id: Optional[int], user_id: int, day_
                 db.session.rollback()
                 return False, get_daily_quota_usage(user_id, day_key)
 
-            quota = _get_or_create_quota_row(user_id, day_key, now)
-            quota.count += 1
-            quota.updated_at = now
+            new_count = _upsert_increment_quota_row(user_id, day_key, now)
+            if new_count is None:
+                quota = _get_or_create_quota_row(user_id, day_key, now)
+                quota.count += 1
+                quota.updated_at = now
+                new_count = quota.count
 
             reservation.status = "consumed"
             reservation.updated_at = now
 
         db.session.commit()
-        return True, quota.count
+        return True, new_count
     except SQLAlchemyError:
         db.session.rollback()
         return False, get_daily_quota_usage(user_id, day_key)
@@ -260,47 +378,35 @@ def check_and_increment_ip_rate_limit(ip: str, limit: int = PER_IP_PER_MIN_LIMIT
         base_values = {"ip": ip, "window_start": window_start, "count": 1, "updated_at": now}
         try:
             if dialect_name == "postgresql":
-                from sqlalchemy.dialects.postgresql import insert as pg_insert
-                stmt = (
-                    pg_insert(IpRateLimit)
-                    .values(**base_values)
-                    .on_conflict_do_update(
-                        index_elements=["ip", "window_start"],
-                        set_={"count": IpRateLimit.__table__.c.count + 1, "updated_at": now},
-                    )
-                    .returning(IpRateLimit.count)
-                )
-                result = db.session.execute(stmt)
-                new_count = result.scalar_one()
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
             elif dialect_name == "sqlite":
-                from sqlalchemy.dialects.sqlite import insert as sqlite_insert
-                stmt = (
-                    sqlite_insert(IpRateLimit)
-                    .values(**base_values)
-                    .on_conflict_do_update(
-                        index_elements=["ip", "window_start"],
-                        set_={"count": IpRateLimit.__table__.c.count + 1, "updated_at": now},
-                    )
-                )
-                db.session.execute(stmt)
-                record = (
-                    db.session.query(IpRateLimit)
-                    .filter_by(ip=ip, window_start=window_start)
-                    .first()
-                )
-                new_count = record.count if record else 0
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
             else:
                 raise SQLAlchemyError("dialect_upsert_not_supported")
 
-            if new_count > limit:
-                db.session.rollback()
-                record = (
-                    db.session.query(IpRateLimit)
+            # The conflict update only fires below the limit, so a blocked
+            # request never bumps the counter and RETURNING comes back empty.
+            count_col = IpRateLimit.__table__.c.count
+            stmt = (
+                dialect_insert(IpRateLimit)
+                .values(**base_values)
+                .on_conflict_do_update(
+                    index_elements=["ip", "window_start"],
+                    set_={"count": count_col + 1, "updated_at": now},
+                    where=count_col < limit,
+                )
+                .returning(count_col)
+            )
+            new_count = db.session.execute(stmt).scalar_one_or_none()
+
+            if new_count is None or new_count > limit:
+                current_count = (
+                    db.session.query(IpRateLimit.count)
                     .filter_by(ip=ip, window_start=window_start)
-                    .first()
+                    .scalar()
                 )
-                current_count = record.count if record else limit
-                return False, current_count
+                db.session.rollback()
+                return False, current_count if current_count is not None else limit
             return True, new_count
         except IntegrityError:
             db.session.rollback()
@@ -358,8 +464,38 @@ def check_and_increment_ip_rate_limit(ip: str, limit: int = PER_IP_PER_MIN_LIMIT
             return False, 0, resets_at
 
 
+def _decrement_quota_row(user_id: int, day_key: date, now_utc: datetime) -> Optional[int]:
+    """Decrement the user's quota row (never below zero) in a single UPDATE ... RETURNING.
+
+    Returns the resulting count, or ``None`` when the dialect has no RETURNING
+    support so the caller can fall back to the lock-and-update path.
+    """
+    if _quota_upsert_insert() is None:
+        return None
+    table = DailyQuotaUsage.__table__
+    stmt = (
+        table.update()
+        .where(table.c.user_id == user_id, table.c.day == day_key, table.c.count > 0)
+        .values(count=table.c.count - 1, updated_at=now_utc)
+        .returning(table.c.count)
+    )
+    new_count = db.session.execute(stmt).scalar_one_or_none()
+    if new_count is None:
+        current = (
+            db.session.query(DailyQuotaUsage.count)
+            .filter_by(user_id=user_id, day=day_key)
+            .scalar()
+        )
+        return current or 0
+    return new_count
+
+
 def rollback_quota_increment(user_id: int, day_key: date) -> int:
     try:
+        current = _decrement_quota_row(user_id, day_key, _utcnow())
+        if current is not None:
+            db.session.commit()
+            return current
         with db.session.begin_nested():
             quota = (
                 db.session.query(DailyQuotaUsage)
@@ -20,7 +20,13 @@ from app.quota import (
     get_client_ip,
     log_access_decision,
 )
-from app.utils.http_helpers import _utcnow, api_error, get_request_id, is_owner_user
+from app.utils.http_helpers import (
+    _utcnow,
+    api_error,
+    current_user_email,
+    get_request_id,
+    is_owner_user,
+)
 from app.utils.validation import ValidationError, validate_analyze_request
 from app.models import AdvisorHistory
 from app.services import advisor_service
@@ -30,12 +36,6 @@ from app.extensions import GEMINI_RECOMMENDER_MODEL_ID
 bp = Blueprint('advisor', __name__)
 
 
-def _current_user_email() -> str:
-    if not current_user.is_authenticated:
-        return ""
-    return getattr(current_user, "email", "")
-
-
 @bp.route('/recommendations')
 def recommendations():
     advisor_owner_only = current_app.config.get('ADVISOR_OWNER_ONLY', False)
@@ -45,7 +45,7 @@ def recommendations():
     return render_template(
         'recommendations.html',
         user=current_user,
-        user_email=_current_user_email(),
+        user_email=current_user_email(),
         is_owner=is_owner_user(),
         advisor_history_profile=None,
         advisor_history_result=None,
@@ -75,7 +75,7 @@ def recommendations_history(history_id):
     return render_template(
         'recommendations.html',
         user=current_user,
-        user_email=_current_user_email(),
+        user_email=current_user_email(),
         is_owner=is_owner_user(),
         advisor_history_profile=profile,
         advisor_history_result=result,
@@ -92,7 +92,10 @@ def advisor_api():
     קורא ל-Gemini 3 Pro, שומר היסטוריה ומחזיר JSON מוכן להצגה.
     """
     advisor_owner_only = current_app.config.get('ADVISOR_OWNER_ONLY', False)
-    per_ip_limit = current_app.config.get('PER_IP_PER_MIN_LIMIT', PER_IP_PER_MIN_LIMIT)
+    per_ip_limit = current_app.config.get(
+        'ADVISOR_PER_IP_PER_MIN_LIMIT',
+        current_app.config.get('PER_IP_PER_MIN_LIMIT', PER_IP_PER_MIN_LIMIT),
+    )
 
     if advisor_owner_only and not is_owner_user():
         log_access_decision(
@@ -111,9 +114,10 @@ def advisor_api():
     log_access_decision('/advisor_api', user_id, 'allowed', 'authenticated user')
 
     client_ip = get_client_ip()
-    ip_allowed, ip_count, ip_resets_at = check_and_increment_ip_rate_limit(client_ip, limit=per_ip_limit)
+    now_utc = _utcnow()
+    ip_allowed, ip_count, ip_resets_at = check_and_increment_ip_rate_limit(client_ip, limit=per_ip_limit, now_utc=now_utc)
     if not ip_allowed:
-        retry_after = max(0, int((ip_resets_at - _utcnow()).total_seconds()))
+        retry_after = max(0, int((ip_resets_at - now_utc).total_seconds()))
         resp = api_error(
             "rate_limited",
             "חרגת ממגבלת הבקשות לדקה.",
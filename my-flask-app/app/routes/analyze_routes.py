@@ -41,9 +41,12 @@ def reliability_report():
 @login_required
 def analyze_car():
     start_time_ms = int(pytime.time() * 1000)
-    app_tz = current_app.config.get("APP_TZ_OBJ", ZoneInfo("UTC"))
+    app_tz = current_app.config.get("APP_TZ_OBJ") or ZoneInfo("UTC")
     owner_bypass_quota = current_app.config.get("OWNER_BYPASS_QUOTA", False)
-    per_ip_limit = current_app.config.get("PER_IP_PER_MIN_LIMIT", PER_IP_PER_MIN_LIMIT)
+    per_ip_limit = current_app.config.get(
+        "ANALYZE_PER_IP_PER_MIN_LIMIT",
+        current_app.config.get("PER_IP_PER_MIN_LIMIT", PER_IP_PER_MIN_LIMIT),
+    )
     reservation_ttl = current_app.config.get("QUOTA_RESERVATION_TTL_SECONDS", QUOTA_RESERVATION_TTL_SECONDS)
     
     # Log access decision
@@ -51,9 +54,10 @@ def analyze_car():
     log_access_decision('/analyze', user_id, 'allowed', 'authenticated user')
 
     client_ip = get_client_ip()
-    ip_allowed, ip_count, ip_resets_at = check_and_increment_ip_rate_limit(client_ip, limit=per_ip_limit)
+    now_utc = _utcnow()
+    ip_allowed, ip_count, ip_resets_at = check_and_increment_ip_rate_limit(client_ip, limit=per_ip_limit, now_utc=now_utc)
     if not ip_allowed:
-        retry_after = max(0, int((ip_resets_at - _utcnow()).total_seconds()))
+        retry_after = max(0, int((ip_resets_at - now_utc).total_seconds()))
         resp = api_error(
             "rate_limited",
             "חרגת ממגבלת הבקשות לדקה.",
@@ -28,7 +28,7 @@ from app.legal import (
     has_accepted_feature,
 )
 from app.models import LegalAcceptance, QuotaReservation
-from app.utils.http_helpers import api_error, api_ok, is_owner_user, get_request_id, _utcnow
+from app.utils.http_helpers import api_error, api_ok, current_user_email, is_owner_user, get_request_id, _utcnow
 from app.services import comparison_service
 from app.services.gemini_health_verdict import log_product_call_verdict_input
 from app.services.comparison.model_config import comparison_stage_a_model_id
@@ -57,7 +57,7 @@ def compare_page():
             compare_result_ack_key=COMPARE_RESULT_ACK_KEY,
             compare_result_ack_version=COMPARE_RESULT_ACK_VERSION,
         )
-    user_email = getattr(current_user, "email", "") if current_user.is_authenticated else ""
+    user_email = current_user_email()
     terms_version = current_app.config.get("TERMS_VERSION", TERMS_VERSION)
     privacy_version = current_app.config.get("PRIVACY_VERSION", PRIVACY_VERSION)
     legal_accepted = LegalAcceptance.query.filter_by(
@@ -108,9 +108,10 @@ def compare_api():
     
     # Rate limit check
     client_ip = get_client_ip()
-    ip_allowed, ip_count, ip_resets_at = check_and_increment_ip_rate_limit(client_ip, limit=per_ip_limit)
+    now_utc = _utcnow()
+    ip_allowed, ip_count, ip_resets_at = check_and_increment_ip_rate_limit(client_ip, limit=per_ip_limit, now_utc=now_utc)
     if not ip_allowed:
-        retry_after = max(0, int((ip_resets_at - _utcnow()).total_seconds()))
+        retry_after = max(0, int((ip_resets_at - now_utc).total_seconds()))
         resp = api_error(
             "rate_limited",
             "חרגת ממגבלת הבקשות לדקה.",
@@ -145,8 +146,9 @@ def compare_api():
     session_id = session.get('_id') if not user_id else None
     
     # Daily quota enforcement
-    tz, _ = resolve_app_timezone()
-    day_key, _, _, resets_at, _, _ = compute_quota_window(tz)
+    # APP_TZ_OBJ is resolved once in create_app; avoid re-reading APP_TZ per request.
+    tz = current_app.config.get("APP_TZ_OBJ") or resolve_app_timezone()[0]
+    day_key, _, _, resets_at, _, _ = compute_quota_window(tz, now=now_utc)
     daily_limit = current_app.config.get("USER_DAILY_LIMIT", USER_DAILY_LIMIT)
     owner_bypass = is_owner_user()
     request_id = get_request_id()
@@ -163,7 +165,7 @@ def compare_api():
         if idempotency_key:
             idem_request_id = f"idem:{idempotency_key}"
             idem_ttl_seconds = int(current_app.config.get("COMPARE_IDEMPOTENCY_TTL_SECONDS", 300))
-            ttl_cutoff = _utcnow() - timedelta(seconds=idem_ttl_seconds)
+            ttl_cutoff = now_utc - timedelta(seconds=idem_ttl_seconds)
             existing = (
                 QuotaReservation.query
                 .filter(
@@ -185,7 +187,7 @@ def compare_api():
         try:
             if not idempotent_retry:
                 ok, used, _active, reservation_id = reserve_daily_quota(
-                    user_id, day_key, daily_limit, reservation_request_id
+                    user_id, day_key, daily_limit, reservation_request_id, now_utc=now_utc
                 )
             else:
                 ok, used = True, get_daily_quota_usage(user_id, day_key)
@@ -252,6 +252,8 @@ def accept_research_consent():
             }
         )
 
+    accepted_ip = normalize_legal_ip(get_client_ip())
+    user_agent = (request.headers.get("User-Agent") or "")[:512]
     consent = ResearchConsent(
         user_id=user_id,
         anon_id=anon_id,
@@ -260,16 +262,16 @@ def accept_research_consent():
         privacy_version=privacy_version,
         research_notice_version=research_notice_version,
         accepted_at=_utcnow(),
-        accepted_ip=normalize_legal_ip(get_client_ip()),
-        accepted_user_agent=(request.headers.get("User-Agent") or "")[:512],
+        accepted_ip=accepted_ip,
+        accepted_user_agent=user_agent,
         accepted_lang=(request.accept_languages.best or "")[:32],
         accepted_source=((data.get("accepted_source") or "web")[:64]),
         is_explicit=True,
         is_informed=True,
         consent_given=True,
         source_page=((data.get("accepted_source") or "web")[:64]),
-        ip_hash=_hash_value(normalize_legal_ip(get_client_ip())),
-        user_agent_hash=_hash_value((request.headers.get("User-Agent") or "")[:512]),
+        ip_hash=_hash_value(accepted_ip),
+        user_agent_hash=_hash_value(user_agent),
     )
     db.session.add(consent)
     try:
@@ -16,7 +16,7 @@ logger = logging.getLogger(__name__)
 
 bp = Blueprint('owner', __name__)
 
-_SLUG_RE = re.compile(r'^[a-z0-9][a-z0-9-]{1,62}$')
+_SLUG_RE = re.compile(r'[a-z0-9][a-z0-9-]{1,62}')
 _MAX_SELECTIONS = 4
 
 
@@ -88,7 +88,7 @@ def owner_examples_update():
                 "history_id must be an integer",
                 status=400,
             )
-        if not _SLUG_RE.match(slug):
+        if not _SLUG_RE.fullmatch(slug):
             return api_error(
                 "validation_error",
                 f"slug '{slug}' is invalid (a-z0-9 and hyphens only)",
@@ -22,7 +22,10 @@ from app.legal import (
 )
 from app.models import User
 from app.utils.analytics import track_event
-from app.services.vehicle_catalog_service import get_vehicle_catalog_ui_data
+from app.services.vehicle_catalog_service import (
+    get_vehicle_catalog_ui_data,
+    get_vehicle_catalog_ui_json,
+)
 from app.utils.http_helpers import (
     api_ok,
     get_redirect_uri,
@@ -66,6 +69,7 @@ def app_page():
     return render_template(
         'reliability_app.html',
         car_models_data=get_vehicle_catalog_ui_data(),
+        car_models_json=get_vehicle_catalog_ui_json(),
         user=current_user,
         is_owner=is_owner_user(),
         reliability_results_acknowledged=reliability_results_acknowledged,
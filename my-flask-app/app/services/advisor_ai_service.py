@@ -57,79 +57,21 @@ turbo_map_he = {
 }
 
 
-def make_user_profile(
-    budget_min,
-    budget_max,
-    years_range,
-    fuels,
-    gears,
-    turbo_required,
-    main_use,
-    annual_km,
-    driver_age,
-    family_size,
-    cargo_need,
-    safety_required,
-    trim_level,
-    weights,
-    body_style,
-    driving_style,
-    excluded_colors,
-):
-    return {
-        "budget_nis": [float(budget_min), float(budget_max)],
-        "years": [int(years_range[0]), int(years_range[1])],
-        "fuel": [f.lower() for f in fuels],
-        "gear": [g.lower() for g in gears],
-        "turbo_required": None if turbo_required == "any" else (turbo_required == "yes"),
-        "main_use": main_use.strip(),
-        "annual_km": int(annual_km),
-        "driver_age": int(driver_age),
-        "family_size": family_size,
-        "cargo_need": cargo_need,
-        "safety_required": safety_required,
-        "trim_level": trim_level,
-        "weights": weights,
-        "body_style": body_style,
-        "driving_style": driving_style,
-        "excluded_colors": excluded_colors,
-    }
-
-
-def sanitize_profile_for_prompt(profile: dict) -> dict:
-    """Recursively escape user profile fields before prompt construction."""
-    if isinstance(profile, dict):
-        return {k: sanitize_profile_for_prompt(v) for k, v in profile.items()}
-    if isinstance(profile, list):
-        return [sanitize_profile_for_prompt(v) for v in profile]
-    if isinstance(profile, str):
-        return escape_prompt_input(profile, max_length=300)
-    return profile
-
-
-def car_advisor_call_gemini_with_search(profile: dict) -> dict:
-    """
-    קריאה ל-Gemini 3 Pro (SDK החדש) עם Google Search ו-output כ-JSON בלבד.
-    """
-    start_time = pytime.perf_counter()
-    try:
-        if extensions.advisor_client is None:
-            return {"_error": "Gemini Car Advisor client unavailable."}
-
-        sanitized_profile = sanitize_profile_for_prompt(profile)
-        bounded_profile = wrap_user_input_in_boundary(
-            json.dumps(sanitized_profile, ensure_ascii=False, indent=2),
-            boundary_tag="user_input"
-        )
-        data_instruction = create_data_only_instruction()
-
-        prompt = f"""
-{data_instruction}
+# Round-trip lookup tables for car_advisor_postprocess: any known Hebrew or
+# (lowercased) English value resolves to its normalized form and Hebrew display
+# string in a single dict access. Every key is already case-folded, so callers
+# look up the lowercased value once instead of trying the raw value first.
+_FUEL_ROUNDTRIP = {
+    **{he: (en, he) for he, en in fuel_map.items()},
+    **{en: (en, he) for en, he in fuel_map_he.items()},
+}
+_GEAR_HE_ROUNDTRIP = {**{he: he for he in gear_map}, **gear_map_he}
+_TURBO_HE_ROUNDTRIP = {**{he: he for he in turbo_map}, **turbo_map_he}
 
-Please recommend cars for an Israeli customer. Here is the user profile (JSON wrapped in <user_input>):
-{bounded_profile}
 
-You are an independent automotive data analyst for the **Israeli used car market**.
+# Static advisor instructions. Built once at import time; only the data
+# instruction and the bounded user profile are interpolated per request.
+ADVISOR_PROMPT_BODY = """You are an independent automotive data analyst for the **Israeli used car market**.
 Your job is to rank cars by the customer's stated preferences and taste, not to override or re-educate the customer.
 
 🔴 CRITICAL INSTRUCTION: USE GOOGLE SEARCH TOOL
@@ -176,10 +118,10 @@ recommended_cars: array of 5–10 cars. EACH car MUST include:
 
 Where feasible, keep the current schema and ALSO add these richer fields per car:
   - trim_levels_israel: array of Israeli trim objects with sources when known
-  - official_safety: {{"rating":"string|null","organization":"string|null","sources":["url"]}}
-  - license_fee_israel: {{"annual_fee_ils": number|null, "method":"official|unknown", "sources":["url"]}}
-  - warranty_israel: {{"vehicle_warranty":"string|null","battery_warranty":"string|null","sources":["url"]}}
-  - competitors: [{{"model":"string","why_consider":"string"}}]
+  - official_safety: {"rating":"string|null","organization":"string|null","sources":["url"]}
+  - license_fee_israel: {"annual_fee_ils": number|null, "method":"official|unknown", "sources":["url"]}
+  - warranty_israel: {"vehicle_warranty":"string|null","battery_warranty":"string|null","sources":["url"]}
+  - competitors: [{"model":"string","why_consider":"string"}]
   - best_for: ["Hebrew string"]
   - not_ideal_for: ["Hebrew string"]
   - practical_summary: "Hebrew practical summary"
@@ -211,6 +153,81 @@ IMPORTANT MARKET REALITY:
 Return ONLY raw JSON. Do not add any backticks or explanation text.
 """
 
+
+def make_user_profile(
+    budget_min,
+    budget_max,
+    years_range,
+    fuels,
+    gears,
+    turbo_required,
+    main_use,
+    annual_km,
+    driver_age,
+    family_size,
+    cargo_need,
+    safety_required,
+    trim_level,
+    weights,
+    body_style,
+    driving_style,
+    excluded_colors,
+):
+    return {
+        "budget_nis": [float(budget_min), float(budget_max)],
+        "years": [int(years_range[0]), int(years_range[1])],
+        "fuel": [f.lower() for f in fuels],
+        "gear": [g.lower() for g in gears],
+        "turbo_required": None if turbo_required == "any" else (turbo_required == "yes"),
+        "main_use": main_use.strip(),
+        "annual_km": int(annual_km),
+        "driver_age": int(driver_age),
+        "family_size": family_size,
+        "cargo_need": cargo_need,
+        "safety_required": safety_required,
+        "trim_level": trim_level,
+        "weights": weights,
+        "body_style": body_style,
+        "driving_style": driving_style,
+        "excluded_colors": excluded_colors,
+    }
+
+
+def sanitize_profile_for_prompt(profile: dict) -> dict:
+    """Recursively escape user profile fields before prompt construction."""
+    if isinstance(profile, dict):
+        return {k: sanitize_profile_for_prompt(v) for k, v in profile.items()}
+    if isinstance(profile, list):
+        return [sanitize_profile_for_prompt(v) for v in profile]
+    if isinstance(profile, str):
+        return escape_prompt_input(profile, max_length=300)
+    return profile
+
+
+def car_advisor_call_gemini_with_search(profile: dict) -> dict:
+    """
+    קריאה ל-Gemini 3 Pro (SDK החדש) עם Google Search ו-output כ-JSON בלבד.
+    """
+    start_time = pytime.perf_counter()
+    try:
+        if extensions.advisor_client is None:
+            return {"_error": "Gemini Car Advisor client unavailable."}
+
+        sanitized_profile = sanitize_profile_for_prompt(profile)
+        bounded_profile = wrap_user_input_in_boundary(
+            json.dumps(sanitized_profile, ensure_ascii=False, indent=2),
+            boundary_tag="user_input"
+        )
+        data_instruction = create_data_only_instruction()
+
+        prompt = (
+            f"\n{data_instruction}\n\n"
+            "Please recommend cars for an Israeli customer. "
+            "Here is the user profile (JSON wrapped in <user_input>):\n"
+            f"{bounded_profile}\n\n"
+            f"{ADVISOR_PROMPT_BODY}"
+        )
+
         search_tool = genai_types.Tool(
             google_search=genai_types.GoogleSearch()
         )
@@ -263,6 +280,13 @@ Return ONLY raw JSON. Do not add any backticks or explanation text.
         )
 
 
+def _as_float(x) -> float:
+    try:
+        return float(x)
+    except Exception:
+        return 0.0
+
+
 def car_advisor_postprocess(profile: dict, parsed: dict) -> dict:
     """
     מקבל profile + פלט גולמי מג'מיני, מחשב עלויות שנתיות,
@@ -285,6 +309,7 @@ def car_advisor_postprocess(profile: dict, parsed: dict) -> dict:
     annual_km = profile.get("annual_km", 15000)
     fuel_price = profile.get("fuel_price_nis_per_liter", 7.0)
     elec_price = profile.get("electricity_price_nis_per_kwh", 0.65)
+    annual_100km = annual_km / 100.0
 
     processed = []
     for car in recommended:
@@ -296,20 +321,8 @@ def car_advisor_postprocess(profile: dict, parsed: dict) -> dict:
         gear_val = str(car.get("gear", "")).strip()
         turbo_val = car.get("turbo")
 
-        if fuel_val in fuel_map:
-            fuel_norm = fuel_map[fuel_val]
-        else:
-            fuel_norm = fuel_val.lower()
-
-        if gear_val in gear_map:
-            gear_norm = gear_map[gear_val]
-        else:
-            gear_norm = gear_val.lower()
-
-        if isinstance(turbo_val, str):
-            turbo_norm = turbo_map.get(turbo_val, turbo_val)
-        else:
-            turbo_norm = turbo_val
+        fuel_key = fuel_val.lower()
+        fuel_norm, fuel_display = _FUEL_ROUNDTRIP.get(fuel_key) or (fuel_key, fuel_val)
 
         avg_fc = car.get("avg_fuel_consumption")
         try:
@@ -322,19 +335,13 @@ def car_advisor_postprocess(profile: dict, parsed: dict) -> dict:
         annual_energy_cost = None
         if avg_fc_num is not None:
             if fuel_norm == "electric":
-                annual_energy_cost = (annual_km / 100.0) * avg_fc_num * elec_price
+                annual_energy_cost = annual_100km * avg_fc_num * elec_price
             else:
                 annual_energy_cost = (annual_km / avg_fc_num) * fuel_price
 
-        def as_float(x):
-            try:
-                return float(x)
-            except Exception:
-                return 0.0
-
-        maintenance_cost = as_float(car.get("maintenance_cost"))
-        insurance_cost = as_float(car.get("insurance_cost"))
-        annual_fee = as_float(car.get("annual_fee"))
+        maintenance_cost = _as_float(car.get("maintenance_cost"))
+        insurance_cost = _as_float(car.get("insurance_cost"))
+        annual_fee = _as_float(car.get("annual_fee"))
 
         if annual_energy_cost is not None:
             total_annual_cost = annual_energy_cost + maintenance_cost + insurance_cost + annual_fee
@@ -348,9 +355,9 @@ def car_advisor_postprocess(profile: dict, parsed: dict) -> dict:
         car["annual_fee"] = round(annual_fee, 0)
         car["total_annual_cost"] = round(total_annual_cost, 0) if total_annual_cost is not None else None
 
-        car["fuel"] = fuel_map_he.get(fuel_norm, fuel_val or fuel_norm)
-        car["gear"] = gear_map_he.get(gear_norm, gear_val or gear_norm)
-        car["turbo"] = turbo_map_he.get(turbo_norm, turbo_val)
+        car["fuel"] = fuel_display
+        car["gear"] = _GEAR_HE_ROUNDTRIP.get(gear_val.lower(), gear_val)
+        car["turbo"] = _TURBO_HE_ROUNDTRIP.get(turbo_val, turbo_val)
 
         processed.append(car)
 
@@ -31,6 +31,11 @@ from app.factory import (
 
 logger = logging.getLogger(__name__)
 
+# Bound lookups for the Hebrew form values; resolved once at import time.
+_fuel_get = fuel_map.get
+_gear_get = gear_map.get
+_turbo_get = turbo_map.get
+
 
 def handle_advisor_logic(payload, user, user_id):
     """
@@ -112,20 +117,18 @@ def handle_advisor_logic(payload, user, user_id):
         )
 
     # --- מיפוי דלק/גיר/טורבו מהעברית לערכים לוגיים ---
-    fuels = (
-        [fuel_map.get(f, "gasoline") for f in fuels_he] if fuels_he else ["gasoline"]
-    )
+    fuels = [_fuel_get(f, "gasoline") for f in fuels_he] if fuels_he else ["gasoline"]
 
     if "חשמלי" in fuels_he:
         gears = ["automatic"]
     else:
         gears = (
-            [gear_map.get(g, "automatic") for g in gears_he]
+            [_gear_get(g, "automatic") for g in gears_he]
             if gears_he
             else ["automatic"]
         )
 
-    turbo_choice = turbo_map.get(turbo_choice_he, "any")
+    turbo_choice = _turbo_get(turbo_choice_he, "any")
 
     # --- בניית user_profile כמו ב-Car Advisor (Streamlit) ---
     user_profile = make_user_profile(
@@ -80,6 +80,42 @@ _LOCKED_IDENTITY_FIELDS = (
 )
 
 
+# Request fields /analyze accepts; anything else is rejected by validation.
+_ANALYZE_ALLOWED_FIELDS = frozenset({
+    "make",
+    "model",
+    "year",
+    "mileage_range",
+    "fuel_type",
+    "transmission",
+    "sub_model",
+    "legal_confirm",
+    "annual_km",
+    "city_pct",
+    "terrain",
+    "climate",
+    "parking",
+    "driver_style",
+    "load",
+    "mileage_km",
+    "trim",
+    "engine",
+    "ownership_history",
+    "budget",
+    "budget_min",
+    "budget_max",
+    "usage_city_pct",
+    "variant_id",
+    "version_or_trim",
+    "body_type",
+    "catalog_fuel_type",
+    "catalog_engine",
+    "catalog_horsepower_hp",
+    "catalog_transmission",
+    "catalog_drivetrain",
+})
+
+
 def _build_identity_snapshot(resolution: Dict[str, Any]) -> Dict[str, Any]:
     """Server-owned identity snapshot derived strictly from the catalog."""
     snapshot = {"source": "catalog", "variant_id": resolution.get("variant_id"),
@@ -147,6 +183,14 @@ _DEPRECATED_SCORE_KEYS = (
 )
 
 
+_BUYER_SUMMARY_FORBIDDEN_PATTERNS = (
+    (_re.compile(r'\d+\s*/\s*100'), 'numeric_score_100'),
+    (_re.compile(r'\d+\s*/\s*10(?!\d)'), 'numeric_score_10'),
+    (_re.compile(r'\d+\s*%'), 'percentage_score'),
+    (_re.compile(r'(?:אני\s+ממליץ|הייתי\s+קונה|מומלץ\s+לקנות|כדאי\s+לקנות|אל\s+תקנה)'), 'first_person_or_verdict'),
+)
+
+
 def _validate_vehicle_profile_buyer_summary(ai_output: dict, request_id: str) -> dict:
     """Validate buyer_summary in vehicle_profile for forbidden content.
 
@@ -161,15 +205,8 @@ def _validate_vehicle_profile_buyer_summary(ai_output: dict, request_id: str) ->
     if not isinstance(buyer_summary, str):
         return ai_output
 
-    forbidden_patterns = [
-        (r'\d+\s*/\s*100', 'numeric_score_100'),
-        (r'\d+\s*/\s*10(?!\d)', 'numeric_score_10'),
-        (r'\d+\s*%', 'percentage_score'),
-        (r'(?:אני\s+ממליץ|הייתי\s+קונה|מומלץ\s+לקנות|כדאי\s+לקנות|אל\s+תקנה)', 'first_person_or_verdict'),
-    ]
-
-    for pattern, reason in forbidden_patterns:
-        if _re.search(pattern, buyer_summary):
+    for pattern, reason in _BUYER_SUMMARY_FORBIDDEN_PATTERNS:
+        if pattern.search(buyer_summary):
             logging.getLogger(__name__).warning(
                 "[VEHICLE_PROFILE] buyer_summary rejected: forbidden_content=%s request_id=%s",
                 reason, request_id,
@@ -276,11 +313,14 @@ def handle_analyze_request(
 ):
     logger = current_app.logger
 
-    day_key, _, _, resets_at, _, retry_after_seconds = compute_quota_window(app_tz)
+    now_utc = _utcnow()
+    day_key, _, _, resets_at, _, retry_after_seconds = compute_quota_window(app_tz, now=now_utc)
     resets_at_iso = resets_at.isoformat()
     cache_hit = False
     reservation_id = None
-    consumed_count = get_daily_quota_usage(user_id, day_key)
+    # reserve_daily_quota reads the consumed count inside its own transaction,
+    # so only the owner bypass path (which never reserves) pays a usage read.
+    consumed_count = get_daily_quota_usage(user_id, day_key) if bypass_owner else 0
     reserved_count = 0
     quota_used_after = consumed_count
     display_quota_count = quota_used_after
@@ -290,44 +330,10 @@ def handle_analyze_request(
     guardrail_duration_ms = 0
     history_id = None
 
-    analyze_allowed_fields = {
-        "make",
-        "model",
-        "year",
-        "mileage_range",
-        "fuel_type",
-        "transmission",
-        "sub_model",
-        "legal_confirm",
-        "annual_km",
-        "city_pct",
-        "terrain",
-        "climate",
-        "parking",
-        "driver_style",
-        "load",
-        "mileage_km",
-        "trim",
-        "engine",
-        "ownership_history",
-        "budget",
-        "budget_min",
-        "budget_max",
-        "usage_city_pct",
-        "variant_id",
-        "version_or_trim",
-        "body_type",
-        "catalog_fuel_type",
-        "catalog_engine",
-        "catalog_horsepower_hp",
-        "catalog_transmission",
-        "catalog_drivetrain",
-    }
-
     try:
         validated = validate_analyze_request(
             data,
-            allowed_fields=analyze_allowed_fields,
+            allowed_fields=_ANALYZE_ALLOWED_FIELDS,
         )
 
         logger.info(
@@ -431,7 +437,7 @@ def handle_analyze_request(
                     day_key,
                     limit_val,
                     get_request_id(),
-                    now_utc=_utcnow(),
+                    now_utc=now_utc,
                 )
             )
         except QuotaInternalError:
@@ -650,7 +656,12 @@ def handle_analyze_request(
                 duration_ms=model_duration_ms,
             )
             db.session.add(new_log)
-            db.session.commit()
+            if bypass_owner:
+                db.session.commit()
+            else:
+                # Flush for the id only; finalize_quota_reservation commits the
+                # history row and the quota charge in one transaction.
+                db.session.flush()
             history_id = new_log.id
             logger.info(
                 "[CACHE] stored cache_key=%s user_id=%s request_id=%s",
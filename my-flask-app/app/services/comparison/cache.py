@@ -33,12 +33,12 @@ def _safe_json_obj(value, default):
             return value
 
         if isinstance(value, str):
-            stripped = value.strip()
-            if not stripped:
+            # json.loads skips surrounding whitespace itself; don't copy the blob
+            if not value or value.isspace():
                 return default
 
             # First decode attempt
-            result = json.loads(stripped)
+            result = json.loads(value)
 
             # Check if result is still a string (double-encoded)
             if isinstance(result, str):
@@ -151,22 +151,28 @@ BUYER_PROFILE_PRIORITY_MIN = 0
 BUYER_PROFILE_PRIORITY_MAX = 10
 
 CAR_PROFILE_MAX_NESTING_DEPTH = 5
-_COMPARE_SLOT_RE = re.compile(r"^car_(\d+)$")
-_DECISION_SLOT_FIELD_RE = re.compile(r"^(?:choose|avoid_or_check)_(car_\d+)_if$")
+# Whole-key patterns: always use .fullmatch() (a "$" anchor would also accept a trailing newline).
+_COMPARE_SLOT_RE = re.compile(r"car_(\d+)")
+_DECISION_SLOT_FIELD_RE = re.compile(r"(?:choose|avoid_or_check)_(car_\d+)_if")
 
-_STAGE_A_REQUIRED_KEYS = {
+_STAGE_A_REQUIRED_KEYS = frozenset({
     "grounding_successful",
     "search_queries_used",
     "assumptions",
     "cars",
-}
+})
 
-_SINGLE_CAR_REQUIRED_CATEGORIES = {
+_SINGLE_CAR_REQUIRED_CATEGORIES = frozenset({
     "reliability",
     "ownership_cost",
     "comfort_practicality",
     "performance_driving",
-}
+})
+
+# Required keys for the Stage B writer payload and each of its categories.
+# Frozen once so per-item checks are a single C-level ``issubset`` call.
+_COMPARE_WRITER_REQUIRED_KEYS = frozenset({"summary", "winner", "categories", "caveats"})
+_COMPARE_WRITER_CATEGORY_REQUIRED_KEYS = frozenset({"name", "winner", "why", "tips"})
 
 # Patterns that indicate a schema echo or placeholder output rather than real data
 SCHEMA_ECHO_PATTERNS = [
@@ -5,6 +5,7 @@ from typing import Dict, Optional, Tuple
 
 from app.services.comparison.constants import COMPARISON_MODEL_ID
 from app.services.comparison.metrics import _inc_compare_metric
+from app.services.comparison.parsing import _collapse_whitespace_prefix
 
 
 logger = logging.getLogger(__name__)
@@ -38,8 +39,7 @@ def _safe_ai_response_snippet(exc: Exception, max_len: int = 280) -> str:
                 text = str(content)
     except Exception:
         text = ""
-    text = " ".join(str(text).split())
-    return text[:max_len]
+    return _collapse_whitespace_prefix(str(text), max_len)
 
 
 def _log_ai_client_error(
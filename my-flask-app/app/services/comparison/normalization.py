@@ -108,12 +108,13 @@ _PUBLIC_FORBIDDEN_RE = re.compile(
     r"(לא ידוע|לבדיקה|לא מאומת|לא אומת|יש לאמת|דורש אימות|מידע חסר|אין מספיק מידע|מחקר חלקי|דטרמיניסטית|קטלוג מקומי|התאמת קטלוג|מקור מאומת|בסיס נתונים|generated|deterministic|catalog fallback|confidence|data_basis)",
     re.IGNORECASE,
 )
+_SEATS_RE = re.compile(r"\d{1,2}")
 
 def _is_public_checked_value(value: Any, *, seats: bool = False) -> bool:
     text = " ".join(str(value or "").split()).strip()
     if not text or _PUBLIC_FORBIDDEN_RE.search(text):
         return False
-    if seats and not re.fullmatch(r"\d{1,2}", text):
+    if seats and not _SEATS_RE.fullmatch(text):
         return False
     return True
 
@@ -124,7 +125,7 @@ def public_checked_versions(payload: Any) -> Dict[str, Dict[str, str]]:
     allowed = ["make", "model", "year", "trim", "version_or_trim", "engine_type", "transmission", "drivetrain", "seats"]
     cleaned: Dict[str, Dict[str, str]] = {}
     for slot_key, raw in payload.items():
-        if not isinstance(raw, dict) or not _COMPARE_SLOT_RE.match(str(slot_key)):
+        if not isinstance(raw, dict) or not _COMPARE_SLOT_RE.fullmatch(str(slot_key)):
             continue
         slot: Dict[str, str] = {}
         for key in allowed:
@@ -359,11 +360,11 @@ def ordered_compare_slot_keys(*sources: Any) -> List[str]:
         else:
             keys = source or []
         for key in keys:
-            if isinstance(key, str) and _COMPARE_SLOT_RE.match(key) and key not in seen:
+            if isinstance(key, str) and _COMPARE_SLOT_RE.fullmatch(key) and key not in seen:
                 seen.add(key)
                 ordered.append(key)
     return sorted(
-        ordered, key=lambda value: int(_COMPARE_SLOT_RE.match(value).group(1))
+        ordered, key=lambda value: int(_COMPARE_SLOT_RE.fullmatch(value).group(1))
     )
 
 
@@ -16,6 +16,12 @@ from app.services.comparison.constants import (
     _STAGE_A_REQUIRED_KEYS,
 )
 
+_FENCE_OPEN_RE = re.compile(r"^```[a-zA-Z0-9_-]*\s*")
+_FENCE_CLOSE_RE = re.compile(r"\s*```$")
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_TRAILING_COMMA_RE = re.compile(r",(\s*[}\]])")
+_SCHEMA_ECHO_RES = tuple(re.compile(pattern) for pattern in SCHEMA_ECHO_PATTERNS)
+
 # Rich Stage A keys that can appear at top-level or inside car_profile
 RICH_STAGE_A_KEYS = (
     "catalog_identity",
@@ -52,7 +58,7 @@ def _extract_decision_slot_keys(decision_result: Any) -> List[str]:
         return []
     extracted: List[str] = []
     for key in decision_result.keys():
-        match = _DECISION_SLOT_FIELD_RE.match(str(key))
+        match = _DECISION_SLOT_FIELD_RE.fullmatch(str(key))
         if match:
             extracted.append(match.group(1))
     key_differences = decision_result.get("key_differences")
@@ -60,7 +66,7 @@ def _extract_decision_slot_keys(decision_result: Any) -> List[str]:
         if not isinstance(item, dict):
             continue
         for key in item.keys():
-            if isinstance(key, str) and _COMPARE_SLOT_RE.match(key):
+            if isinstance(key, str) and _COMPARE_SLOT_RE.fullmatch(key):
                 extracted.append(key)
     return _ordered_compare_slot_keys(extracted)
 
@@ -212,8 +218,8 @@ def normalize_single_car_payload(
 def _strip_json_code_fences(text: str) -> str:
     stripped = (text or "").strip()
     if stripped.startswith("```"):
-        stripped = re.sub(r"^```[a-zA-Z0-9_-]*\s*", "", stripped, count=1)
-        stripped = re.sub(r"\s*```$", "", stripped, count=1)
+        stripped = _FENCE_OPEN_RE.sub("", stripped, count=1)
+        stripped = _FENCE_CLOSE_RE.sub("", stripped, count=1)
     return stripped.strip()
 
 
@@ -296,8 +302,8 @@ def _repair_json_once(text: str) -> str:
     }
     for src, dst in smart_quotes.items():
         repaired = repaired.replace(src, dst)
-    repaired = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", repaired)
-    repaired = re.sub(r",(\s*[}\]])", r"\1", repaired)
+    repaired = _CONTROL_CHARS_RE.sub("", repaired)
+    repaired = _TRAILING_COMMA_RE.sub(r"\1", repaired)
     return repaired.strip()
 
 
@@ -343,13 +349,24 @@ def _extract_stage_a_error_code(errors: List[str]) -> str:
     return _truncate_error_message(code_or_message, 96) or "UNKNOWN"
 
 
+def _collapse_whitespace_prefix(text: str, limit: int) -> str:
+    """Return ``" ".join(text.split())[:limit]`` without splitting all of ``text``."""
+    window = limit * 2 + 64
+    if len(text) > window:
+        # Collapsing a prefix yields a prefix of the fully collapsed text, so a
+        # long enough head is sufficient for large model payloads.
+        head = " ".join(text[:window].split())
+        if len(head) >= limit:
+            return head[:limit]
+    return " ".join(text.split())[:limit]
+
+
 def _truncate_log_payload(value: Any, limit: int = 300) -> str:
     try:
         raw = json.dumps(value, ensure_ascii=False)
     except Exception:
         raw = str(value)
-    raw = " ".join(raw.split())
-    return raw[:limit]
+    return _collapse_whitespace_prefix(raw, limit)
 
 
 def _safe_ai_response_snippet(exc: Exception, max_len: int = 280) -> str:
@@ -369,7 +386,7 @@ def _is_valid_single_car_payload(payload: Any) -> bool:
     if top_keys <= {"status", "checked_areas", "open_fields", "sources_found", "research_status"}:
         return False
     # Accept legacy categories
-    if _SINGLE_CAR_REQUIRED_CATEGORIES.intersection(set(payload.keys())):
+    if not _SINGLE_CAR_REQUIRED_CATEGORIES.isdisjoint(payload):
         return True
     # Accept non-empty car_profile dict
     car_profile = payload.get("car_profile")
@@ -394,10 +411,9 @@ def _is_schema_echo(payload: Any) -> bool:
     raw = json.dumps(payload, ensure_ascii=False)
 
     # Check for known schema placeholder patterns
-    import re as _re
     placeholder_hits = 0
-    for pattern in SCHEMA_ECHO_PATTERNS:
-        if _re.search(pattern, raw):
+    for pattern in _SCHEMA_ECHO_RES:
+        if pattern.search(raw):
             placeholder_hits += 1
     if placeholder_hits >= 1:
         return True
@@ -461,7 +477,7 @@ def _is_schema_echo_text(raw_text: str) -> bool:
 def _is_valid_stage_a_payload(payload: Any) -> bool:
     return (
         isinstance(payload, dict)
-        and set(payload.keys()) >= _STAGE_A_REQUIRED_KEYS
+        and _STAGE_A_REQUIRED_KEYS.issubset(payload)
         and isinstance(payload.get("grounding_successful"), bool)
         and isinstance(payload.get("search_queries_used"), list)
         and isinstance(payload.get("assumptions"), dict)
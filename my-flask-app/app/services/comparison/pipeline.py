@@ -108,7 +108,7 @@ def handle_comparison_request(
 
         if cached and cached.computed_result:
             logger.info(
-                f"[COMPARISON] cache hit request_id={request_id} hash={request_hash}"
+                "[COMPARISON] cache hit request_id=%s hash=%s", request_id, request_hash
             )
 
             # Safely parse all cached JSON fields, handling double-encoded data
@@ -516,10 +516,10 @@ def handle_comparison_request(
         comparison_id = comparison_record.id
         db_ms = int((pytime.perf_counter() - db_start) * 1000)
         logger.info(
-            f"[COMPARISON] saved request_id={request_id} comparison_id={comparison_id}"
+            "[COMPARISON] saved request_id=%s comparison_id=%s", request_id, comparison_id
         )
     except Exception as e:
-        logger.error(f"[COMPARISON] save failed request_id={request_id} error={e}")
+        logger.error("[COMPARISON] save failed request_id=%s error=%s", request_id, e)
         db.session.rollback()
         comparison_id = None
     finally:
@@ -23,6 +23,8 @@ from app.services.comparison.constants import (
     PARTIAL_COMPARISON_DISCLAIMER,
     PARTIAL_COMPARISON_SUMMARY_PREFIX,
     TIE_THRESHOLD,
+    _COMPARE_WRITER_CATEGORY_REQUIRED_KEYS,
+    _COMPARE_WRITER_REQUIRED_KEYS,
 )
 from app.services.comparison.decision import (
     _append_unique_text,
@@ -203,8 +205,7 @@ def _validate_compare_writer_response(
 ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
     if not isinstance(payload, dict):
         return None, "payload_not_object"
-    required_keys = {"summary", "winner", "categories", "caveats"}
-    if not required_keys.issubset(payload.keys()):
+    if not _COMPARE_WRITER_REQUIRED_KEYS.issubset(payload):
         return None, "missing_required_keys"
 
     summary = _truncate_to_word_limit(payload.get("summary"), 80)
@@ -223,8 +224,7 @@ def _validate_compare_writer_response(
     for item in categories:
         if not isinstance(item, dict):
             return None, "invalid_category_item"
-        required_category_keys = {"name", "winner", "why", "tips"}
-        if not required_category_keys.issubset(item.keys()):
+        if not _COMPARE_WRITER_CATEGORY_REQUIRED_KEYS.issubset(item):
             return None, "missing_category_keys"
         if item.get("name") not in COMPARE_CATEGORY_NAMES:
             return None, "invalid_category_name"
@@ -921,7 +921,7 @@ Return this EXACT JSON structure:
             current_app.logger.warning("[NARRATIVE] Timeout generating narrative")
             return None
         except Exception as e:
-            current_app.logger.warning(f"[NARRATIVE] Call failed: {type(e).__name__}")
+            current_app.logger.warning("[NARRATIVE] Call failed: %s", type(e).__name__)
             return None
 
         if resp is None:
@@ -950,7 +950,7 @@ Return this EXACT JSON structure:
         return None
 
     except Exception as e:
-        current_app.logger.warning(f"[NARRATIVE] Unexpected error: {e}")
+        current_app.logger.warning("[NARRATIVE] Unexpected error: %s", e)
         return None
 
 
@@ -9,6 +9,7 @@ import json
 import logging
 import os
 import uuid
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import requests
@@ -169,7 +170,10 @@ def _gemini_key_info() -> Dict[str, Any]:
     return {"source": source, "fingerprint": fingerprint}
 
 
+@lru_cache(maxsize=1)
 def _sdk_version() -> str:
+    # importlib.metadata scans site-packages; the installed version can't
+    # change under a running worker, so resolve it once.
     try:
         import importlib.metadata
         return importlib.metadata.version("google-genai")
@@ -191,6 +195,9 @@ def _log_request_config(
     prompt: str,
 ) -> None:
     """Log a safe [AI_DEBUG] gemini_request_config event before each Gemini call."""
+    # Skip hashing the whole prompt and JSON-encoding the event when INFO is off.
+    if not logger.isEnabledFor(logging.INFO):
+        return
     key_info = _gemini_key_info()
     prompt_sha = hashlib.sha256(prompt.encode()).hexdigest()[:16]
     log_data: Dict[str, Any] = {
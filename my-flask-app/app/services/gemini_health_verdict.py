@@ -374,6 +374,8 @@ def log_product_call_verdict_input(
 ) -> None:
     """Emit ``[AI_PRODUCT_CALL_VERDICT_INPUT]`` so product calls can be compared
     against the health matrix. No secrets, no full prompts."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     if prompt is not None:
         prompt_chars = len(prompt)
         prompt_sha = hashlib.sha256(prompt.encode()).hexdigest()[:16]
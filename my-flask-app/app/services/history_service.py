@@ -3,7 +3,9 @@
 
 import json
 from typing import Any, Dict, List, Tuple, Optional
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import load_only
 
 from flask import current_app
 
@@ -21,6 +23,28 @@ from app.utils.sanitization import (
 DASHBOARD_SEARCH_LIMIT = 50
 DASHBOARD_ADVISOR_LIMIT = 50
 
+# Only the columns the dashboard cards read; skips e.g. the advisor profile blob.
+# Search cards are read-only, so they are fetched as plain Core rows (attribute
+# access by column name) without ORM identity-map/instrumentation overhead.
+_DASHBOARD_SEARCH_COLUMNS = (
+    SearchHistory.id,
+    SearchHistory.timestamp,
+    SearchHistory.make,
+    SearchHistory.model,
+    SearchHistory.year,
+    SearchHistory.mileage_range,
+    SearchHistory.fuel_type,
+    SearchHistory.transmission,
+    SearchHistory.result_json,
+    SearchHistory.duration_ms,
+)
+_DASHBOARD_ADVISOR_COLUMNS = load_only(
+    AdvisorHistory.id,
+    AdvisorHistory.timestamp,
+    AdvisorHistory.result_json,
+    AdvisorHistory.duration_ms,
+)
+
 
 def fetch_dashboard_history(user_id: int) -> Tuple[list, list, Optional[str], Optional[str]]:
     search_error = None
@@ -28,9 +52,12 @@ def fetch_dashboard_history(user_id: int) -> Tuple[list, list, Optional[str], Op
     logger = current_app.logger
 
     try:
-        user_searches = SearchHistory.query.filter_by(
-            user_id=user_id
-        ).order_by(SearchHistory.timestamp.desc()).limit(DASHBOARD_SEARCH_LIMIT).all()
+        user_searches = db.session.execute(
+            select(*_DASHBOARD_SEARCH_COLUMNS)
+            .where(SearchHistory.user_id == user_id)
+            .order_by(SearchHistory.timestamp.desc())
+            .limit(DASHBOARD_SEARCH_LIMIT)
+        ).all()
     except Exception:
         search_error = "לא הצלחנו לטעון את ההיסטוריה כעת."
         try:
@@ -41,7 +68,7 @@ def fetch_dashboard_history(user_id: int) -> Tuple[list, list, Optional[str], Op
         user_searches = []
 
     try:
-        advisor_entries = AdvisorHistory.query.filter_by(
+        advisor_entries = AdvisorHistory.query.options(_DASHBOARD_ADVISOR_COLUMNS).filter_by(
             user_id=user_id
         ).order_by(AdvisorHistory.timestamp.desc()).limit(DASHBOARD_ADVISOR_LIMIT).all()
     except Exception:
@@ -98,7 +125,7 @@ def _extract_lightweight_card_fields(parsed_result: Dict[str, Any]) -> Dict[str,
     return card
 
 
-def build_searches_data(user_searches: List[SearchHistory]) -> list:
+def build_searches_data(user_searches: list) -> list:
     """Build lightweight search-history cards for the dashboard list.
 
     Per-row guardrail validation is replaced by a single batch sanitise pass
@@ -138,7 +165,7 @@ def build_searches_data(user_searches: List[SearchHistory]) -> list:
             "mileage_range": s.mileage_range or '',
             "fuel_type": s.fuel_type or '',
             "transmission": s.transmission or '',
-            "duration_ms": getattr(s, "duration_ms", None),
+            "duration_ms": s.duration_ms,
             **card_fields,
         })
     if total:
@@ -219,7 +246,7 @@ def search_details_response(search_id: int, user_id: int):
             db.session.rollback()
         except Exception:
             current_app.logger.exception("[DETAILS] rollback failed request_id=%s", get_request_id())
-        current_app.logger.error(f"[DETAILS] Error fetching search details: {e}")
+        current_app.logger.error("[DETAILS] Error fetching search details: %s", e)
         return api_error("details_fetch_failed", "שגיאת שרת בשליפת נתוני חיפוש", status=500)
 
 
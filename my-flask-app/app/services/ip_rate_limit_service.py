@@ -38,47 +38,35 @@ def check_and_increment_ip_rate_limit(ip: str, limit: int = PER_IP_PER_MIN_LIMIT
         base_values = {"ip": ip, "window_start": window_start, "count": 1, "updated_at": now}
         try:
             if dialect_name == "postgresql":
-                from sqlalchemy.dialects.postgresql import insert as pg_insert
-                stmt = (
-                    pg_insert(IpRateLimit)
-                    .values(**base_values)
-                    .on_conflict_do_update(
-                        index_elements=["ip", "window_start"],
-                        set_={"count": IpRateLimit.__table__.c.count + 1, "updated_at": now},
-                    )
-                    .returning(IpRateLimit.count)
-                )
-                result = db.session.execute(stmt)
-                new_count = result.scalar_one()
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
             elif dialect_name == "sqlite":
-                from sqlalchemy.dialects.sqlite import insert as sqlite_insert
-                stmt = (
-                    sqlite_insert(IpRateLimit)
-                    .values(**base_values)
-                    .on_conflict_do_update(
-                        index_elements=["ip", "window_start"],
-                        set_={"count": IpRateLimit.__table__.c.count + 1, "updated_at": now},
-                    )
-                )
-                db.session.execute(stmt)
-                record = (
-                    db.session.query(IpRateLimit)
-                    .filter_by(ip=ip, window_start=window_start)
-                    .first()
-                )
-                new_count = record.count if record else 0
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
             else:
                 raise SQLAlchemyError("dialect_upsert_not_supported")
 
-            if new_count > limit:
-                db.session.rollback()
-                record = (
-                    db.session.query(IpRateLimit)
+            # The conflict update only fires below the limit, so a blocked
+            # request never bumps the counter and RETURNING comes back empty.
+            count_col = IpRateLimit.__table__.c.count
+            stmt = (
+                dialect_insert(IpRateLimit)
+                .values(**base_values)
+                .on_conflict_do_update(
+                    index_elements=["ip", "window_start"],
+                    set_={"count": count_col + 1, "updated_at": now},
+                    where=count_col < limit,
+                )
+                .returning(count_col)
+            )
+            new_count = db.session.execute(stmt).scalar_one_or_none()
+
+            if new_count is None or new_count > limit:
+                current_count = (
+                    db.session.query(IpRateLimit.count)
                     .filter_by(ip=ip, window_start=window_start)
-                    .first()
+                    .scalar()
                 )
-                current_count = record.count if record else limit
-                return False, current_count
+                db.session.rollback()
+                return False, current_count if current_count is not None else limit
             return True, new_count
         except IntegrityError:
             db.session.rollback()
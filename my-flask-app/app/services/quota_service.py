@@ -10,7 +10,14 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from app.config import MAX_ACTIVE_RESERVATIONS, QUOTA_RESERVATION_TTL_SECONDS
 from app.extensions import db
 from app.models import DailyQuotaUsage, QuotaReservation
-from app.quota import QuotaInternalError
+from app.quota import (
+    QuotaInternalError,
+    _decrement_quota_row,
+    _insert_reservation_row,
+    _lock_quota_row_count,
+    _upsert_increment_quota_row,
+    _upsert_increment_quota_row_within_limit,
+)
 from app.utils.http_helpers import _utcnow
 
 logger = logging.getLogger(__name__)
@@ -113,8 +120,9 @@ def reserve_daily_quota(user_id: int, day_key: date, limit: int, request_id: str
                 day_key,
             )
         with db.session.begin_nested():
-            quota = _get_or_create_quota_row(user_id, day_key, now)
-            consumed_count = quota.count
+            consumed_count = _lock_quota_row_count(user_id, day_key, now)
+            if consumed_count is None:
+                consumed_count = _get_or_create_quota_row(user_id, day_key, now).count
 
             active_reserved = (
                 db.session.query(QuotaReservation)
@@ -130,17 +138,7 @@ def reserve_daily_quota(user_id: int, day_key: date, limit: int, request_id: str
                 db.session.rollback()
                 return False, consumed_count, active_reserved, None
 
-            reservation = QuotaReservation(
-                user_id=user_id,
-                day=day_key,
-                status="reserved",
-                request_id=request_id,
-                created_at=now,
-                updated_at=now,
-            )
-            db.session.add(reservation)
-            db.session.flush()
-            reservation_id = reservation.id
+            reservation_id = _insert_reservation_row(user_id, day_key, request_id, now)
 
         db.session.commit()
         return True, consumed_count, active_reserved + 1, reservation_id
@@ -169,15 +167,18 @@ def finalize_quota_reservation(reservation_id: Optional[int], user_id: int, day_
                 db.session.rollback()
                 return False, get_daily_quota_usage(user_id, day_key)
 
-            quota = _get_or_create_quota_row(user_id, day_key, now)
-            quota.count += 1
-            quota.updated_at = now
+            new_count = _upsert_increment_quota_row(user_id, day_key, now)
+            if new_count is None:
+                quota = _get_or_create_quota_row(user_id, day_key, now)
+                quota.count += 1
+                quota.updated_at = now
+                new_count = quota.count
 
             reservation.status = "consumed"
             reservation.updated_at = now
 
         db.session.commit()
-        return True, quota.count
+        return True, new_count
     except SQLAlchemyError as e:
         logger.error("[QUOTA] Finalize failed for user %s: %s", user_id, type(e).__name__)
         db.session.rollback()
@@ -228,6 +229,20 @@ def check_and_increment_daily_quota(user_id: int, limit: int, day_key: date, now
 
     now = now_utc or _utcnow()
 
+    try:
+        upserted = _upsert_increment_quota_row_within_limit(user_id, day_key, limit, now)
+    except SQLAlchemyError as e:
+        logger.error("[QUOTA] Error checking quota for user %s: %s", user_id, type(e).__name__)
+        db.session.rollback()
+        return False, 0
+    if upserted is not None:
+        allowed, current_count = upserted
+        if allowed:
+            db.session.commit()
+        else:
+            db.session.rollback()
+        return allowed, current_count
+
     try:
         with db.session.begin_nested():
             try:
@@ -302,6 +317,10 @@ def rollback_quota_increment(user_id: int, day_key: date) -> int:
     Roll back a previously recorded quota increment (best-effort).
     """
     try:
+        current = _decrement_quota_row(user_id, day_key, _utcnow())
+        if current is not None:
+            db.session.commit()
+            return current
         with db.session.begin_nested():
             quota = (
                 db.session.query(DailyQuotaUsage)
@@ -23,11 +23,26 @@ from app.extensions import GEMINI_RELIABILITY_MODEL_ID
 
 logger = logging.getLogger(__name__)
 
+_FENCE_OPEN_RE = _re.compile(r"^```[a-zA-Z0-9_-]*\s*")
+_FENCE_CLOSE_RE = _re.compile(r"\s*```$")
+
 PRIMARY_MODEL = os.environ.get("PRIMARY_MODEL", GEMINI_RELIABILITY_MODEL_ID)
 FALLBACK_MODEL = os.environ.get("FALLBACK_MODEL", GEMINI_RELIABILITY_MODEL_ID)
 RETRIES = int(os.environ.get("RETRIES", "2"))
 RETRY_BACKOFF_SEC = float(os.environ.get("RETRY_BACKOFF_SEC", "1"))
 
+# Legacy-SDK model handles are stateless wrappers around the model name, so
+# one instance per name is reused across requests instead of re-validating
+# config on every call.
+_MODEL_CACHE: dict = {}
+
+
+def _get_model(model_name: str):
+    model = _MODEL_CACHE.get(model_name)
+    if model is None:
+        model = _MODEL_CACHE[model_name] = genai.GenerativeModel(model_name)
+    return model
+
 
 def call_model_with_retry(prompt: str) -> dict:
     """Call Gemini AI model with retry logic, exponential backoff, and timeout.
@@ -46,9 +61,11 @@ def call_model_with_retry(prompt: str) -> dict:
     if genai is None:
         raise RuntimeError("Legacy Gemini SDK unavailable")
     last_err = None
-    for model_name in [PRIMARY_MODEL, FALLBACK_MODEL]:
+    # FALLBACK_MODEL defaults to the primary model; retrying the same model a
+    # second full round only doubles the worst-case wait before the error.
+    for model_name in dict.fromkeys((PRIMARY_MODEL, FALLBACK_MODEL)):
         try:
-            llm = genai.GenerativeModel(model_name)
+            llm = _get_model(model_name)
         except Exception as e:
             last_err = e
             logger.error("[AI] init %s: %s", model_name, e)
@@ -80,17 +97,11 @@ def call_model_with_retry(prompt: str) -> dict:
                 if not raw:
                     raise ValueError("Empty response from model")
                 
-                try:
-                    # Try to extract JSON from response
-                    m = _re.search(r"\{.*\}", raw, _re.DOTALL)
-                    data = json.loads(m.group()) if m else json.loads(raw)
-                except Exception:
-                    # Fallback: use json-repair for malformed JSON
-                    data = json.loads(repair_json(raw))
-                
-                # Validate that response is a dict (not a list or primitive)
-                if not isinstance(data, dict):
-                    raise ValueError(f"Model returned non-object JSON: {type(data).__name__}")
+                # Plain json.loads first; json-repair only runs on the
+                # extracted object when that fails.
+                data, parse_err = parse_model_json(raw)
+                if data is None:
+                    raise ValueError(f"Model returned invalid JSON: {parse_err}")
                 
                 logger.info("[AI] success with %s", model_name)
                 return data
@@ -118,8 +129,8 @@ def call_model_with_retry(prompt: str) -> dict:
 def _strip_code_fences(text: str) -> str:
     stripped = (text or "").strip()
     if stripped.startswith("```"):
-        stripped = _re.sub(r"^```[a-zA-Z0-9_-]*\s*", "", stripped, count=1)
-        stripped = _re.sub(r"\s*```$", "", stripped, count=1)
+        stripped = _FENCE_OPEN_RE.sub("", stripped, count=1)
+        stripped = _FENCE_CLOSE_RE.sub("", stripped, count=1)
     return stripped.strip()
 
 
@@ -156,6 +167,16 @@ def parse_model_json(raw: str) -> Tuple[Optional[dict], Optional[str]]:
     if not raw:
         return None, "EMPTY_RESPONSE"
     cleaned = _strip_code_fences(raw)
+    # Well-formed model output is the common case. When the whole text parses as
+    # an object, the brace scanner below would return that same text, so skip
+    # its per-character pass over the (often 5-50 KB) response.
+    if cleaned.startswith("{"):
+        try:
+            parsed = json.loads(cleaned)
+        except Exception:
+            parsed = None
+        if isinstance(parsed, dict):
+            return parsed, None
     candidate = _extract_first_json_object(cleaned)
     for text in (candidate, cleaned):
         if not text:
@@ -110,6 +110,9 @@ REVIEW_RESPONSE_SCHEMA = {
     "final_line": "This information highlights areas to verify and is not a substitute for a professional inspection.",
 }
 
+# Rendered once; the schema is static and the prompt only embeds its text.
+_REVIEW_RESPONSE_SCHEMA_JSON = json.dumps(REVIEW_RESPONSE_SCHEMA, ensure_ascii=False, indent=2)
+
 
 def build_reliability_report_prompt(payload: dict, missing_info: list[str]) -> str:
     """Prompt for the strict reliability report JSON schema."""
@@ -206,7 +209,7 @@ def build_combined_prompt(payload: dict, missing_info: list[str], resolution: di
     )
     data_instruction = create_data_only_instruction()
     locked_identity = _build_locked_identity_block(resolution)
-    schema_json = json.dumps(REVIEW_RESPONSE_SCHEMA, ensure_ascii=False, indent=2)
+    schema_json = _REVIEW_RESPONSE_SCHEMA_JSON
     status = resolution.get("resolution_status") or "unmatched"
     if status in ("exact", "inferred"):
         identity_rule = (
@@ -13,6 +13,9 @@ import logging
 import os
 from typing import Any, Dict, List, Mapping, Optional, Tuple
 
+from jinja2.utils import htmlsafe_json_dumps
+from markupsafe import Markup
+
 logger = logging.getLogger(__name__)
 
 _DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "data")
@@ -20,6 +23,7 @@ _CATALOG_PATH = os.path.join(_DATA_DIR, "model_technical_catalog_il.json")
 
 _catalog_cache: Optional[Dict[str, Any]] = None
 _ui_data_cache: Optional[Dict[str, Any]] = None
+_ui_json_cache: Optional[Markup] = None
 _flat_cache: Optional[List[Dict[str, Any]]] = None
 _catalog_hash_cache: Optional[str] = None
 
@@ -298,6 +302,23 @@ def get_vehicle_catalog_ui_data() -> Dict[str, Any]:
     return _ui_data_cache
 
 
+def get_vehicle_catalog_ui_json() -> Markup:
+    """Return :func:`get_vehicle_catalog_ui_data` as HTML-safe JSON, serialized once.
+
+    Equivalent to ``{{ data | tojson }}`` in a template, but the multi-MB
+    catalog is only encoded on the first call instead of on every page render.
+    """
+    global _ui_json_cache
+    if _ui_json_cache is None:
+        _ui_json_cache = htmlsafe_json_dumps(
+            get_vehicle_catalog_ui_data(),
+            dumps=json.dumps,
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+    return _ui_json_cache
+
+
 def get_flat_vehicle_catalog() -> List[Dict[str, Any]]:
     """Return a flat list of ``{make, model, display, year_start, year_end}``
     suitable for autocomplete search on the comparison page.
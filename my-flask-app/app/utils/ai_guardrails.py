@@ -31,6 +31,9 @@ LOW_SAMPLE_NOTE = "מדגם משתמשים קטן — נתון כיוון בלב
 _LOGGER = logging.getLogger(__name__)
 _HEBREW_RE = re.compile(r"[א-ת]")
 _NUM_RE = re.compile(r"-?\d+(?:[.,]\d+)?")
+_PATH_SEPARATORS_RE = re.compile(r"[/_]+")
+_NON_NUMERIC_RE = re.compile(r"[^\d,.\-]")
+_TRAILING_HEDGE_RE = re.compile(r"(?:בדרך כלל|usually|typically)$")
 _PII_PATTERNS = (
     re.compile(r"\b\d{2,3}[-\s]?\d{2,3}[-\s]?\d{2,3}\b"),
     re.compile(r"\b0\d{1,2}[-\s]?\d{3}[-\s]?\d{4}\b"),
@@ -49,6 +52,10 @@ _LOW_CONF_STRONG_PHRASES = {
     "always": "often",
     "never": "not typically",
 }
+_LOW_CONF_STRONG_PHRASE_RES = tuple(
+    (re.compile(re.escape(phrase), re.IGNORECASE), replacement)
+    for phrase, replacement in _LOW_CONF_STRONG_PHRASES.items()
+)
 _CONNECTOR_ENDINGS = {
     "and",
     "or",
@@ -107,10 +114,11 @@ def safe_json_obj(value: Any, default: Any = None) -> Any:
             return value
         if not isinstance(value, str):
             return fallback
-        stripped = value.strip()
-        if not stripped:
+        # json.loads already skips surrounding whitespace; avoid copying the
+        # (often multi-KB) stored blob just to strip it.
+        if not value or value.isspace():
             return fallback
-        parsed = json.loads(stripped)
+        parsed = json.loads(value)
         if isinstance(parsed, str):
             parsed = json.loads(parsed)
         return parsed if isinstance(parsed, (dict, list)) else fallback
@@ -123,7 +131,8 @@ def _text(value: Any) -> str:
 
 
 def _norm_key(value: Any) -> str:
-    return re.sub(r"\s+", " ", _text(value)).strip().lower()
+    # _text already collapses and trims whitespace.
+    return _text(value).lower()
 
 
 def _parse_float(value: Any) -> Optional[float]:
@@ -210,7 +219,7 @@ def _finalize_report(report: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def normalize_make_model(value: Any) -> str:
-    text = re.sub(r"[/_]+", " ", _text(value))
+    text = _PATH_SEPARATORS_RE.sub(" ", _text(value))
     if not text:
         return ""
     if _HEBREW_RE.search(text):
@@ -263,7 +272,7 @@ def normalize_currency_ils(value: Any) -> Optional[int]:
         return None
     if isinstance(value, (int, float)):
         return int(round(float(value)))
-    text = re.sub(r"[^\d,.\-]", "", str(value))
+    text = _NON_NUMERIC_RE.sub("", str(value))
     if text.count(",") and "." not in text:
         text = text.replace(",", "")
     else:
@@ -339,8 +348,8 @@ def downgrade_overconfident_language(text: Any, confidence: Any) -> str:
     if not normalized or confidence_value is None or confidence_value >= 70:
         return normalized
     softened = normalized
-    for phrase, replacement in _LOW_CONF_STRONG_PHRASES.items():
-        softened = re.sub(re.escape(phrase), replacement, softened, flags=re.IGNORECASE)
+    for pattern, replacement in _LOW_CONF_STRONG_PHRASE_RES:
+        softened = pattern.sub(replacement, softened)
     return softened
 
 
@@ -356,9 +365,10 @@ def is_probably_truncated_text(text: Any) -> bool:
         return True
     if value.count("\"") % 2 == 1:
         return True
-    if re.search(r"(?:בדרך כלל|usually|typically)$", value.lower()):
+    lowered = value.lower()
+    if _TRAILING_HEDGE_RE.search(lowered):
         return True
-    tail = value.lower().split()[-1]
+    tail = lowered.split()[-1]
     return tail in _CONNECTOR_ENDINGS
 
 
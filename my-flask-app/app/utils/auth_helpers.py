@@ -4,7 +4,7 @@
 import os
 import functools
 
-from flask import abort, current_app
+from flask import abort, current_app, g, has_request_context
 from flask_login import current_user
 
 
@@ -19,7 +19,23 @@ def is_owner(user=None):
     u = user if user is not None else current_user
     if not getattr(u, "is_authenticated", False):
         return False
-    email = (getattr(u, "email", "") or "").lower().strip()
+
+    # The context processor and route guards ask about the current user several
+    # times per request; memoize that answer on g.
+    cache_key = None
+    if (user is None or user is current_user) and has_request_context():
+        cache_key = u.get_id()
+        cached = g.get("_is_owner")
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+    result = _email_is_owner((getattr(u, "email", "") or "").lower().strip())
+    if cache_key is not None:
+        g._is_owner = (cache_key, result)
+    return result
+
+
+def _email_is_owner(email):
     if not email:
         return False
 
@@ -29,11 +45,8 @@ def is_owner(user=None):
         return True
 
     # Multi OWNER_EMAILS from app config
-    owner_set = current_app.config.get("OWNER_EMAILS", set())
-    if email in owner_set:
-        return True
-
-    return False
+    owner_set = current_app.config.get("OWNER_EMAILS", frozenset())
+    return email in owner_set
 
 
 def owner_required(f):
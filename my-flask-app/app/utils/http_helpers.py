@@ -12,6 +12,21 @@ def _utcnow():
     return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
+# JSON endpoints: exact POST routes plus the JSON-only path prefixes.
+_API_EXACT_PATHS = frozenset({"/analyze", "/advisor_api"})
+_API_PATH_PREFIXES = ("/api/", "/search-details/")
+
+
+def is_api_path() -> bool:
+    """Return True when the current request targets a JSON API endpoint (memoized on ``g``)."""
+    cached = g.get("_is_api_path")
+    if cached is None:
+        path = request.path or ""
+        cached = path in _API_EXACT_PATHS or path.startswith(_API_PATH_PREFIXES)
+        g._is_api_path = cached
+    return cached
+
+
 def get_request_id() -> str:
     """Get the current request_id from Flask g object."""
     return getattr(g, 'request_id', 'unknown')
@@ -38,13 +53,35 @@ def api_error(code: str, message: str, status: int = 400, details: Optional[Mapp
     return resp
 
 
+def current_user_email() -> str:
+    """Return the logged-in user's email ("" for anonymous), memoized on ``g`` per user."""
+    if not current_user.is_authenticated:
+        return ""
+    user_id = current_user.get_id()
+    cached = g.get("_user_email")
+    if cached is not None and cached[0] == user_id:
+        return cached[1]
+    email = getattr(current_user, "email", "") or ""
+    g._user_email = (user_id, email)
+    return email
+
+
 def is_owner_user() -> bool:
-    """Check if current user is an owner (uses app.config['OWNER_EMAILS'])."""
+    """Check if current user is an owner (uses app.config['OWNER_EMAILS']).
+
+    The result is memoized on ``g`` per user for the lifetime of the request.
+    """
     if not current_user.is_authenticated:
         return False
-    email = (getattr(current_user, "email", "") or "").lower()
-    owner_emails = current_app.config.get('OWNER_EMAILS', set())
-    return email in owner_emails
+    user_id = current_user.get_id()
+    cached = g.get("_is_owner_user")
+    if cached is not None and cached[0] == user_id:
+        return cached[1]
+    email = current_user_email().lower()
+    owner_emails = current_app.config.get('OWNER_EMAILS', frozenset())
+    result = email in owner_emails
+    g._is_owner_user = (user_id, result)
+    return result
 
 
 def get_redirect_uri():
@@ -77,4 +114,7 @@ def log_rejection(reason: str, details: str = "") -> None:
     user_id = current_user.id if current_user.is_authenticated else "anonymous"
     endpoint = request.endpoint or "unknown"
     request_id = get_request_id()
-    current_app.logger.warning(f"[REJECT] request_id={request_id} endpoint={endpoint} user={user_id} reason={reason} details={details}")
+    current_app.logger.warning(
+        "[REJECT] request_id=%s endpoint=%s user=%s reason=%s details=%s",
+        request_id, endpoint, user_id, reason, details,
+    )
@@ -16,6 +16,10 @@ from typing import Any
 
 MAX_USER_INPUT_LENGTH = 500
 
+# Zero-width, bidi-override and word-joiner characters used to hide payloads.
+_INVISIBLE_CHARS_RE = re.compile(r'[\u200b-\u200f\u202a-\u202e\u2060-\u2069\ufeff]')
+_WHITESPACE_RE = re.compile(r"\s+")
+
 # ── LAYER 1: Character allowlist ──
 # Only chars that belong in car-related fields.
 # Blocks injection in Chinese/Arabic/Russian/Japanese automatically.
@@ -109,21 +113,21 @@ def escape_prompt_input(value: Any, max_length: int = MAX_USER_INPUT_LENGTH) ->
     # L2: Homoglyph neutralization (Cyrillic А → Latin A)
     text = text.translate(_HOMOGLYPH_MAP)
     # L3: Zero-width + bidi + control chars
-    text = re.sub(r'[\u200b-\u200f\u202a-\u202e\u2060-\u2069\ufeff]', '', text)
+    text = _INVISIBLE_CHARS_RE.sub('', text)
     text = CONTROL_CHARS_PATTERN.sub("", text)
     # Remove combining chars (except Hebrew niqqud range)
     text = ''.join(c for c in text
                    if unicodedata.category(c) not in ('Mn', 'Mc', 'Me')
                    or '\u0590' <= c <= '\u05FF')
     # L4: Collapse whitespace
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE_RE.sub(" ", text).strip()
     # L5: Allowlist — strip non-car-data chars
     text = _ALLOWED_CHARS_RE.sub("", text)
     # L6: Structural pattern stripping
     for pattern in _STRUCTURAL_PATTERNS:
         text = pattern.sub("", text)
     # L7: Final cleanup + cap
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE_RE.sub(" ", text).strip()
     if len(text) > max_length:
         text = text[:max_length].strip()
     return text
@@ -25,6 +25,7 @@ _MAX_STR = 8000
 _MAX_LIST = 50
 _ZERO_WIDTH_RE = re.compile(r"[\u200b-\u200f\u202a-\u202e\u2066-\u2069]")
 _SAFE_URL_RE = re.compile(r"^https?://", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 def _normalize_text(raw: str) -> str:
@@ -36,17 +37,14 @@ def _normalize_text(raw: str) -> str:
             break
         s = unescaped
     s = _ZERO_WIDTH_RE.sub("", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    return _WHITESPACE_RE.sub(" ", s).strip()
 
 
 def _escape(s: Any) -> str:
     if not isinstance(s, str):
         s = "" if s is None else str(s)
-    if len(s) > _MAX_STR:
-        s = s[:_MAX_STR]
-    s = _normalize_text(s)
-    return html.escape(s, quote=False)
+    # Slicing a shorter string returns it unchanged, so no length check is needed.
+    return html.escape(_normalize_text(s[:_MAX_STR]), quote=False)
 
 
 def _sanitize_url(raw: Any) -> str:
@@ -66,6 +64,10 @@ def _coerce_list(value: Any) -> list:
 
 
 def _clamp_int(value: Any, *, lo: int, hi: int, default: int = 0) -> int:
+    # Exact int (model JSON scores/costs) skips the float round-trip and
+    # exception frame; bool is excluded because type(True) is bool.
+    if type(value) is int:
+        return lo if value < lo else hi if value > hi else value
     try:
         if isinstance(value, bool):
             return default
@@ -118,11 +120,8 @@ _SCORE_BREAKDOWN_KEYS = (
 
 def _sanitize_score_breakdown(value: Any) -> Dict[str, int]:
     """Strict 6-key score_breakdown, values clamped to 1..10."""
-    src = _coerce_dict(value)
-    out: Dict[str, int] = {}
-    for k in _SCORE_BREAKDOWN_KEYS:
-        out[k] = _clamp_int(src.get(k), lo=1, hi=10, default=1)
-    return out
+    get = _coerce_dict(value).get
+    return {k: _clamp_int(get(k), lo=1, hi=10, default=1) for k in _SCORE_BREAKDOWN_KEYS}
 
 
 # --- risk_signals sanitization helpers ---
@@ -58,7 +58,9 @@ def validate_form_data(data: Mapping[str, Any], required_fields: Mapping[str, ty
         If a required field is missing or has the wrong type.
     """
 
-    required_fields = required_fields or {}
+    if not required_fields:
+        # Nothing to check: a shallow copy is the whole result.
+        return dict(data.items())
 
     validated: Dict[str, Any] = {}
     for field, expected_type in required_fields.items():
@@ -125,7 +127,8 @@ _FIELD_MAX_LENGTHS = {
 }
 
 _CONTROL_CHARS = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
-_ALLOWED_TEXT_PATTERN = re.compile(r"^[A-Za-z0-9א-ת\s\-.,/'\"()&:+_;?!%₪]+$")
+_WHITESPACE_RE = re.compile(r'\s+')
+_ALLOWED_TEXT_PATTERN = re.compile(r"[A-Za-z0-9א-ת\s\-.,/'\"()&:+_;?!%₪]+")
 
 # Research-only fields used for data enrichment / market research.
 # Owner users bypass validation and required checks for these fields.
@@ -172,6 +175,33 @@ _TEXT_FIELDS_TO_NORMALIZE = {
     'catalog_drivetrain',
 }
 
+# Per-field rules resolved once: (max_length, normalize_as_text, research_only).
+# Iteration order follows _FIELD_MAX_LENGTHS so the first reported error is unchanged.
+_FIELD_RULES = {
+    field: (max_length, field in _TEXT_FIELDS_TO_NORMALIZE, field in _RESEARCH_ONLY_FIELDS)
+    for field, max_length in _FIELD_MAX_LENGTHS.items()
+}
+
+_TEXT_TRANSLATE_MAP = {
+    ord("\u05f3"): "'",
+    ord("\u05f4"): '"',
+    ord("\u2013"): "-",
+    ord("\u2014"): "-",
+    ord("\u2212"): "-",
+    ord("\u2018"): "'",
+    ord("\u2019"): "'",
+    ord("\u201c"): '"',
+    ord("\u201d"): '"',
+    ord("\u00a0"): " ",
+    ord("\u200e"): None,
+    ord("\u200f"): None,
+    ord("\u202a"): None,
+    ord("\u202b"): None,
+    ord("\u202c"): None,
+    ord("\u202d"): None,
+    ord("\u202e"): None,
+}
+
 
 def _check_field_length(field: str, value: Any, max_length: int) -> None:
     """Check if a field exceeds maximum allowed length.
@@ -275,34 +305,17 @@ def _normalize_and_validate_text(field: str, value: Any, max_length: int) -> str
 
     # Unicode-aware normalization before validation
     text = unicodedata.normalize("NFKC", text)
-    translate_map = {
-        ord("\u05f3"): "'",
-        ord("\u05f4"): '"',
-        ord("\u2013"): "-",
-        ord("\u2014"): "-",
-        ord("\u2212"): "-",
-        ord("\u2018"): "'",
-        ord("\u2019"): "'",
-        ord("\u201c"): '"',
-        ord("\u201d"): '"',
-        ord("\u00a0"): " ",
-        ord("\u200e"): None,
-        ord("\u200f"): None,
-        ord("\u202a"): None,
-        ord("\u202b"): None,
-        ord("\u202c"): None,
-        ord("\u202d"): None,
-        ord("\u202e"): None,
-    }
-    text = text.translate(translate_map)
-    # Drop any remaining control/format chars
-    text = ''.join(ch for ch in text if not unicodedata.category(ch).startswith('C'))
+    text = text.translate(_TEXT_TRANSLATE_MAP)
+    # Drop any remaining control/format chars. Every category-C character is
+    # non-printable, so the per-character scan only runs when one may be present.
+    if not text.isprintable():
+        text = ''.join(ch for ch in text if not unicodedata.category(ch).startswith('C'))
     text = _CONTROL_CHARS.sub('', text)
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WHITESPACE_RE.sub(' ', text).strip()
 
     _check_field_length(field, text, max_length)
 
-    if text and not _ALLOWED_TEXT_PATTERN.match(text):
+    if text and not _ALLOWED_TEXT_PATTERN.fullmatch(text):
         raise ValidationError(field, "Field contains invalid characters. Use letters, numbers, spaces, and basic punctuation only.")
 
     return text
@@ -407,15 +420,15 @@ def validate_analyze_request(
                 raise ValidationError("payload", f"Unexpected fields: {', '.join(sorted(unexpected))}")
         
         # Enforce field length limits (Phase 1D: DoS prevention) and normalize text
-        for field, max_length in _FIELD_MAX_LENGTHS.items():
+        for field, (max_length, normalize_text, research_only) in _FIELD_RULES.items():
             if field not in validated:
                 continue
 
             # Owner users skip validation for research-only fields
-            if is_owner and field in _RESEARCH_ONLY_FIELDS:
+            if is_owner and research_only:
                 continue
 
-            if field in _TEXT_FIELDS_TO_NORMALIZE:
+            if normalize_text:
                 validated[field] = _normalize_and_validate_text(field, validated[field], max_length)
             else:
                 _check_field_length(field, validated[field], max_length)
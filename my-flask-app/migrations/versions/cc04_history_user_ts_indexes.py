@@ -0,0 +1,45 @@
+"""index search/advisor history by user and recency
+
+Revision ID: cc04_history_user_ts_indexes
+Revises: bb03_research_260425
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'cc04_history_user_ts_indexes'
+down_revision = 'bb03_research_260425'
+branch_labels = None
+depends_on = None
+
+
+_INDEXES = (
+    ("search_history", "ix_search_history_user_ts"),
+    ("advisor_history", "ix_advisor_history_user_ts"),
+)
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    for table_name, index_name in _INDEXES:
+        if not inspector.has_table(table_name):
+            print(f"[MIGRATION] {table_name} missing; skipping {index_name}")
+            continue
+        indexes = {idx.get("name") for idx in inspector.get_indexes(table_name)}
+        if index_name in indexes:
+            print(f"[MIGRATION] {index_name} already exists; skipping index")
+            continue
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} "
+            f"ON {table_name} (user_id, timestamp DESC);"
+        )
+        print(f"[MIGRATION] {index_name} created")
+
+
+def downgrade():
+    for _table_name, index_name in _INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name};")
@@ -0,0 +1,37 @@
+"""drop quota/rate-limit indexes covered by their unique constraints
+
+Revision ID: dd05_drop_redundant_quota_idx
+Revises: cc04_history_user_ts_indexes
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'dd05_drop_redundant_quota_idx'
+down_revision = 'cc04_history_user_ts_indexes'
+branch_labels = None
+depends_on = None
+
+
+# Both tables are upserted on every AI request. uq_user_day_quota_usage and
+# uq_ip_window already serve every equality lookup, and ix_quota_day_user /
+# ix_ip_rate_limit_window_start still cover the day/window scans, so these
+# only add index pages to write.
+_INDEXES = (
+    ("daily_quota_usage", "ix_daily_quota_usage_day", "day"),
+    ("ip_rate_limit", "ix_ip_rate_limit_ip", "ip"),
+    ("ip_rate_limit", "ix_ip_window", "ip, window_start"),
+)
+
+
+def upgrade():
+    for _table_name, index_name, _columns in _INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name};")
+        print(f"[MIGRATION] {index_name} dropped")
+
+
+def downgrade():
+    for table_name, index_name, columns in _INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({columns});")
@@ -90,3 +90,26 @@ def test_active_review_ui_uses_clean_empty_result_message():
     script = (Path(__file__).resolve().parents[1] / "static" / "script.js").read_text(encoding="utf-8")
     assert "לא הצלחנו לבנות תוצאה מלאה כרגע. כדאי לנסות שוב עם שנתון, מנוע ורמת גימור מדויקים יותר." in script
     assert "renderPartialResearchState(_researchStatus, _requestId)" in script
+
+
+def test_score_breakdown_clamps_ints_and_rejects_bools():
+    sanitized = sanitize_analyze_response({
+        "score_breakdown": {
+            "engine_transmission_score": 14,
+            "electrical_score": 0,
+            "suspension_brakes_score": "7.6",
+            "maintenance_cost_score": True,
+            "satisfaction_score": 8,
+        },
+        "avg_repair_cost_ILS": -50,
+    })
+
+    assert sanitized["score_breakdown"] == {
+        "engine_transmission_score": 10,
+        "electrical_score": 1,
+        "suspension_brakes_score": 7,
+        "maintenance_cost_score": 1,
+        "satisfaction_score": 8,
+        "recalls_score": 1,
+    }
+    assert sanitized["avg_repair_cost_ILS"] == 0
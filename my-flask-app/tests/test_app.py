@@ -13,6 +13,7 @@ from main import (
     SearchHistory,
     db,
     compute_quota_window,
+    finalize_quota_reservation,
     reserve_daily_quota,
     resolve_app_timezone,
 )
@@ -165,6 +166,8 @@ def test_api_schema_error(logged_in_client):
     assert data["ok"] is False
     assert data["error"]["code"] == "validation_error"
     assert "request_id" in data
+    # Hebrew messages are sent as UTF-8, not \uXXXX escapes.
+    assert data["error"]["message"].encode("utf-8") in resp.data
 
 
 def test_api_schema_success(client):
@@ -176,6 +179,45 @@ def test_api_schema_success(client):
     assert "request_id" in data
 
 
+def test_healthz_skips_session_and_cookies(client):
+    resp = client.get("/healthz")
+    assert resp.status_code == 200
+    assert resp.headers.get("X-Request-ID")
+    assert "Set-Cookie" not in resp.headers
+
+
+def test_static_assets_do_not_start_a_session(client):
+    resp = client.get("/static/script.js")
+    assert resp.status_code == 200
+    assert resp.headers.get("X-Content-Type-Options") == "nosniff"
+    assert "Set-Cookie" not in resp.headers
+
+
+def test_large_json_responses_are_gzipped(app):
+    import gzip
+    import json
+
+    from app.utils.http_helpers import api_ok
+
+    @app.route("/_test_big_json")
+    def _big_json():
+        return api_ok({"text": "אמינות " * 500})
+
+    client = app.test_client()
+    plain = client.get("/_test_big_json")
+    assert "Content-Encoding" not in plain.headers
+    assert "Accept-Encoding" in plain.headers.get("Vary", "")
+
+    resp = client.get("/_test_big_json", headers={"Accept-Encoding": "gzip, br"})
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert int(resp.headers["Content-Length"]) < len(plain.data)
+    body = json.loads(gzip.decompress(resp.data))
+    assert body["data"] == plain.get_json()["data"]
+
+    small = client.get("/healthz", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in small.headers
+
+
 def test_favicon_served(client):
     resp = client.get("/favicon.ico")
     assert resp.status_code == 200
@@ -308,20 +350,20 @@ def test_quota_finalized_when_history_save_fails(app, logged_in_client, monkeypa
 
     monkeypatch.setattr(main, "call_gemini_grounded_once", fake_gemini)
 
-    original_commit = main.db.session.commit
+    original_flush = main.db.session.flush
     failure_state = {"raised": False}
 
-    def commit_with_failure():
-        # Fail only on the first commit that tries to persist SearchHistory
+    def flush_with_failure(*args, **kwargs):
+        # Fail only on the first flush that tries to persist SearchHistory
         if (
             any(isinstance(obj, main.SearchHistory) for obj in main.db.session.new)
             and not failure_state["raised"]
         ):
             failure_state["raised"] = True
-            raise RuntimeError("forced commit failure")
-        return original_commit()
+            raise RuntimeError("forced flush failure")
+        return original_flush(*args, **kwargs)
 
-    monkeypatch.setattr(main.db.session, "commit", commit_with_failure)
+    monkeypatch.setattr(main.db.session, "flush", flush_with_failure)
 
     payload = _valid_payload()
     payload["legal_confirm"] = True
@@ -343,6 +385,63 @@ def test_quota_finalized_when_history_save_fails(app, logged_in_client, monkeypa
         assert SearchHistory.query.count() == 0
 
 
+def test_history_and_quota_charge_commit_together(app, logged_in_client, monkeypatch):
+    client, user_id = logged_in_client
+    client.post("/api/legal/accept", json={"legal_confirm": True})
+
+    def fake_gemini(_prompt):
+        return (
+            {
+                "ok": True,
+                "base_score_calculated": 60,
+                "search_performed": True,
+                "search_queries": [],
+                "sources": [],
+                "reliability_report": {},
+            },
+            None,
+        )
+
+    monkeypatch.setattr(main, "call_gemini_grounded_once", fake_gemini)
+
+    from sqlalchemy import event
+
+    state = {"history_flushed": False, "commits_after_history": 0}
+
+    def before_flush(session, _flush_context, _instances):
+        if any(isinstance(obj, main.SearchHistory) for obj in session.new):
+            state["history_flushed"] = True
+
+    original_commit = main.db.session.commit
+
+    def tracking_commit():
+        result = original_commit()
+        if state["history_flushed"]:
+            state["commits_after_history"] += 1
+        return result
+
+    monkeypatch.setattr(main.db.session, "commit", tracking_commit)
+    event.listen(main.db.session, "before_flush", before_flush)
+    try:
+        payload = _valid_payload()
+        payload["legal_confirm"] = True
+        resp = client.post("/analyze", json=payload, headers={"Origin": "http://localhost"})
+    finally:
+        event.remove(main.db.session, "before_flush", before_flush)
+
+    assert resp.status_code == 200
+    assert state["history_flushed"] is True
+    # The history row and the quota charge share a single commit.
+    assert state["commits_after_history"] == 1
+
+    with app.app_context():
+        tz, _ = resolve_app_timezone()
+        day_key, *_ = compute_quota_window(tz)
+        quota = DailyQuotaUsage.query.filter_by(user_id=user_id, day=day_key).first()
+        assert quota and quota.count == 1
+        assert SearchHistory.query.count() == 1
+
+
 def test_ip_rate_limit_single_row(app):
     with app.app_context():
         IpRateLimit.query.delete()
@@ -366,6 +465,26 @@ def test_ip_rate_limit_single_row(app):
         assert rows[0].count == 2
 
 
+def test_ip_rate_limit_blocks_without_incrementing(app):
+    with app.app_context():
+        IpRateLimit.query.delete()
+        db.session.commit()
+
+        now = datetime(2024, 1, 1, 12, 0, 0)
+        results = [
+            main.check_and_increment_ip_rate_limit("5.6.7.8", limit=2, now_utc=now)
+            for _ in range(4)
+        ]
+
+        assert [(ok, count) for ok, count, _ in results] == [
+            (True, 1), (True, 2), (False, 2), (False, 2)
+        ]
+        row = IpRateLimit.query.filter_by(
+            ip="5.6.7.8", window_start=now.replace(second=0, microsecond=0)
+        ).one()
+        assert row.count == 2
+
+
 def test_quota_row_created_once(app, logged_in_client):
     _client, user_id = logged_in_client
     with app.app_context():
@@ -394,6 +513,50 @@ def test_quota_row_created_once(app, logged_in_client):
         assert rows[0].count == 0
 
 
+def test_finalize_reservation_increments_quota_row(app, logged_in_client):
+    _client, user_id = logged_in_client
+    with app.app_context():
+        tz, _ = resolve_app_timezone()
+        day_key, *_ = compute_quota_window(tz)
+        DailyQuotaUsage.query.delete()
+        QuotaReservation.query.delete()
+        db.session.commit()
+
+        counts = []
+        for request_id in ("req-1", "req-2"):
+            ok, _consumed, _reserved, res_id = reserve_daily_quota(
+                user_id, day_key, limit=3, request_id=request_id, now_utc=datetime.utcnow()
+            )
+            assert ok is True
+            finalized, count = finalize_quota_reservation(res_id, user_id, day_key)
+            assert finalized is True
+            counts.append(count)
+
+        assert counts == [1, 2]
+        rows = DailyQuotaUsage.query.filter_by(user_id=user_id, day=day_key).all()
+        assert len(rows) == 1
+        assert rows[0].count == 2
+        statuses = {r.status for r in QuotaReservation.query.filter_by(user_id=user_id).all()}
+        assert statuses == {"consumed"}
+
+
+def test_check_and_increment_daily_quota_stops_at_limit(app, logged_in_client):
+    from app.services.quota_service import check_and_increment_daily_quota
+
+    _client, user_id = logged_in_client
+    with app.app_context():
+        tz, _ = resolve_app_timezone()
+        day_key, *_ = compute_quota_window(tz)
+        DailyQuotaUsage.query.delete()
+        db.session.commit()
+
+        results = [check_and_increment_daily_quota(user_id, 2, day_key) for _ in range(3)]
+
+        assert results == [(True, 1), (True, 2), (False, 2)]
+        rows = DailyQuotaUsage.query.filter_by(user_id=user_id, day=day_key).all()
+        assert len(rows) == 1
+        assert rows[0].count == 2
+
 def test_login_redirects_to_oauth(client, monkeypatch):
     called = {}
 
@@ -519,3 +682,69 @@ def test_pending_rollback_cleared_between_requests(app, logged_in_client):
 
     resp = client.get("/dashboard")
     assert resp.status_code != 500
+
+
+def test_apply_mileage_logic_parses_numeric_and_string_scores():
+    from app.factory import apply_mileage_logic
+
+    out, note = apply_mileage_logic(
+        {"base_score_calculated": 80, "overall_score": "78.5/100"},
+        "150-200k",
+    )
+    assert out["base_score_calculated"] == 70.0
+    assert out["overall_score"] == 68.5
+    assert note
+
+    out, _ = apply_mileage_logic({"overall_score": None}, "150-200k")
+    assert out["overall_score"] is None
+
+
+def test_mileage_adjustment_is_memoized():
+    from app.factory import mileage_adjustment
+
+    first = mileage_adjustment("100-150 אלף")
+    hits_before = mileage_adjustment.cache_info().hits
+    assert mileage_adjustment("100-150 אלף") == first == (
+        -5, "הציון הותאם מעט מטה עקב קילומטראז׳ בינוני-גבוה (100–150 אלף ק״מ)."
+    )
+    assert mileage_adjustment.cache_info().hits == hits_before + 1
+    assert mileage_adjustment("") == (0, None)
+
+
+def test_rollback_quota_increment_never_goes_negative(app, logged_in_client):
+    from app.services.quota_service import check_and_increment_daily_quota, rollback_quota_increment
+
+    _client, user_id = logged_in_client
+    with app.app_context():
+        tz, _ = resolve_app_timezone()
+        day_key, *_ = compute_quota_window(tz)
+        DailyQuotaUsage.query.delete()
+        db.session.commit()
+
+        assert rollback_quota_increment(user_id, day_key) == 0
+        check_and_increment_daily_quota(user_id, 5, day_key)
+        check_and_increment_daily_quota(user_id, 5, day_key)
+
+        assert rollback_quota_increment(user_id, day_key) == 1
+        assert rollback_quota_increment(user_id, day_key) == 0
+        assert rollback_quota_increment(user_id, day_key) == 0
+        assert DailyQuotaUsage.query.filter_by(user_id=user_id, day=day_key).one().count == 0
+
+
+def test_reserve_daily_quota_creates_row_and_respects_consumed(app, logged_in_client):
+    from app.quota import reserve_daily_quota, finalize_quota_reservation
+
+    _client, user_id = logged_in_client
+    with app.app_context():
+        tz, _ = resolve_app_timezone()
+        day_key, *_ = compute_quota_window(tz)
+        DailyQuotaUsage.query.delete()
+        db.session.commit()
+
+        allowed, consumed, reserved, rid = reserve_daily_quota(user_id, day_key, 1, "req-1")
+        assert (allowed, consumed, reserved) == (True, 0, 1)
+        assert DailyQuotaUsage.query.filter_by(user_id=user_id, day=day_key).one().count == 0
+        assert finalize_quota_reservation(rid, user_id, day_key) == (True, 1)
+
+        allowed, consumed, reserved, rid = reserve_daily_quota(user_id, day_key, 1, "req-2")
+        assert (allowed, consumed, reserved, rid) == (False, 1, 0, None)
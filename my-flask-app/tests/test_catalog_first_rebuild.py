@@ -15,6 +15,7 @@ import app.extensions as extensions
 from app.services.vehicle_catalog_service import (
     get_catalog_hash,
     get_vehicle_catalog_ui_data,
+    get_vehicle_catalog_ui_json,
     resolve_comparison_car,
     resolve_vehicle_selection,
 )
@@ -126,6 +127,13 @@ def test_resolver_unmatched_and_bad_variant_id():
     assert bad["resolution_status"] == "unmatched"
 
 
+def test_ui_catalog_json_is_serialized_once():
+    payload = get_vehicle_catalog_ui_json()
+    assert payload is get_vehicle_catalog_ui_json()
+    assert "<" not in payload
+    assert json.loads(payload) == get_vehicle_catalog_ui_data()
+
+
 def test_resolve_comparison_car_is_resolver():
     make, model, variants = _first_multi_variant_model()
     res = resolve_comparison_car({"make": make, "model": model, "variant_id": variants[0]["variant_id"]})
@@ -107,6 +107,30 @@ class TestDashboardPerformanceSafety:
         card_count = html.count("data-search-id=")
         assert card_count <= DASHBOARD_SEARCH_LIMIT
 
+    def test_dashboard_history_skips_unused_columns(self, logged_in_client, app):
+        """Dashboard queries should not load the advisor profile blob."""
+        from sqlalchemy import inspect
+
+        from app.models import AdvisorHistory
+        from app.services.history_service import fetch_dashboard_history
+
+        _client, user_id = logged_in_client
+        with app.test_request_context():
+            db.session.add(
+                AdvisorHistory(
+                    user_id=user_id,
+                    profile_json=json.dumps({"budget_nis": [1, 2]}),
+                    result_json=json.dumps({"recommended_cars": []}),
+                )
+            )
+            db.session.commit()
+            db.session.expunge_all()
+
+            _searches, advisor_entries, _, _ = fetch_dashboard_history(user_id)
+
+            assert len(advisor_entries) == 1
+            assert "profile_json" in inspect(advisor_entries[0]).unloaded
+
     def test_dashboard_no_per_row_guardrail_log(self, logged_in_client, app, caplog):
         """Dashboard should not emit one ai_guardrail_validation log per row."""
         client, user_id = logged_in_client
@@ -23,6 +23,14 @@ class QuotaWindowTests(unittest.TestCase):
         self.assertEqual(resets_at.date(), now_tz.date() + timedelta(days=1))
         self.assertEqual(retry_after, max(0, int((resets_at - now_tz).total_seconds())))
 
+    def test_quota_window_treats_naive_now_as_utc(self):
+        tz = ZoneInfo("Asia/Jerusalem")
+        aware = main.compute_quota_window(tz, now=datetime(2024, 1, 1, 22, 30, tzinfo=ZoneInfo("UTC")))
+        naive = main.compute_quota_window(tz, now=datetime(2024, 1, 1, 22, 30))
+
+        self.assertEqual(naive, aware)
+        self.assertEqual(naive[0], datetime(2024, 1, 1).date() + timedelta(days=1))
+
 
 class OwnerEmailNormalizationTests(unittest.TestCase):
     def test_owner_email_normalization(self):
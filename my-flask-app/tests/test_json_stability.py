@@ -62,6 +62,15 @@ class TestVehicleReviewJsonStability:
         assert err is None
         assert parsed["make"] == "Toyota"
 
+    def test_well_formed_json_skips_brace_scan(self):
+        from app.services import reliability_model_service as svc
+        raw = '{"make": "Mazda", "notes": "brace } inside", "nested": {"a": 1}}'
+        with mock.patch.object(svc, "_extract_first_json_object") as scan:
+            parsed, err = svc.parse_model_json(raw)
+        assert err is None
+        assert parsed["notes"] == "brace } inside"
+        scan.assert_not_called()
+
     def test_invalid_json_after_all_repair_returns_error(self):
         from app.services.reliability_model_service import parse_model_json
         raw = "This is not JSON at all, just plain prose without braces."
@@ -527,3 +536,13 @@ class TestAdvisorJsonStability:
         }
         result = car_advisor_postprocess({"annual_km": 15000}, parsed)
         assert result.get("grounding_confidence") == "unverified"
+
+
+class TestLogSnippetTruncation:
+    def test_truncate_log_payload_matches_full_collapse(self):
+        from app.services.comparison.parsing import _truncate_log_payload
+
+        payload = {"notes": ["a  \n b" * 500], "score": 7}
+        expected = " ".join(json.dumps(payload, ensure_ascii=False).split())[:300]
+        assert _truncate_log_payload(payload) == expected
+        assert _truncate_log_payload("short") == '"short"'
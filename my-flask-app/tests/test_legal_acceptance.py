@@ -17,6 +17,17 @@ def test_protected_endpoint_requires_acceptance(logged_in_client):
     assert data["error"] == "TERMS_NOT_ACCEPTED"
 
 
+def test_non_object_json_payload_is_rejected_without_error(logged_in_client):
+    client, _ = logged_in_client
+    resp = client.post(
+        "/analyze",
+        json=[{"legal_confirm": True}],
+        headers={"Origin": "http://localhost"},
+    )
+    assert resp.status_code == 403
+    assert resp.get_json()["error"] == "TERMS_NOT_ACCEPTED"
+
+
 def test_dashboard_read_only_allows_without_acceptance(logged_in_client):
     client, _ = logged_in_client
     resp = client.get("/dashboard")
@@ -1,5 +1,7 @@
 import types
 
+import pytest
+
 import app.factory as factory
 import app.extensions as extensions
 from main import create_app
@@ -88,3 +90,73 @@ def test_owner_email_env_populates_owner_config(monkeypatch):
     app = create_app()
 
     assert app.config["OWNER_EMAILS"] == {"owner@example.com"}
+
+
+def test_call_model_with_retry_reuses_cached_legacy_model(monkeypatch):
+    from app.services import reliability_model_service as svc
+
+    created = []
+
+    class FakeLegacyModel:
+        def __init__(self, name):
+            created.append(name)
+
+        def generate_content(self, prompt, generation_config=None):
+            return types.SimpleNamespace(text='{"ok": true}')
+
+    monkeypatch.setattr(svc, "genai", types.SimpleNamespace(GenerativeModel=FakeLegacyModel))
+    monkeypatch.setattr(svc, "_MODEL_CACHE", {})
+
+    assert svc.call_model_with_retry("prompt") == {"ok": True}
+    assert svc.call_model_with_retry("prompt") == {"ok": True}
+    assert created == [svc.PRIMARY_MODEL]
+
+
+def test_call_model_with_retry_skips_fallback_equal_to_primary(monkeypatch):
+    from app.services import reliability_model_service as svc
+
+    calls = []
+
+    class FailingLegacyModel:
+        def __init__(self, name):
+            self.name = name
+
+        def generate_content(self, prompt, generation_config=None):
+            calls.append(self.name)
+            raise RuntimeError("boom")
+
+    monkeypatch.setattr(svc, "genai", types.SimpleNamespace(GenerativeModel=FailingLegacyModel))
+    monkeypatch.setattr(svc, "_MODEL_CACHE", {})
+    monkeypatch.setattr(svc, "PRIMARY_MODEL", "model-a")
+    monkeypatch.setattr(svc, "FALLBACK_MODEL", "model-a")
+    monkeypatch.setattr(svc.pytime, "sleep", lambda _s: None)
+
+    with pytest.raises(RuntimeError):
+        svc.call_model_with_retry("prompt")
+    assert calls == ["model-a"] * svc.RETRIES
+
+    calls.clear()
+    monkeypatch.setattr(svc, "FALLBACK_MODEL", "model-b")
+    with pytest.raises(RuntimeError):
+        svc.call_model_with_retry("prompt")
+    assert calls == ["model-a"] * svc.RETRIES + ["model-b"] * svc.RETRIES
+
+
+def test_call_model_with_retry_parses_fenced_json_without_repair(monkeypatch):
+    from app.services import reliability_model_service as svc
+
+    class FencedLegacyModel:
+        def __init__(self, name):
+            pass
+
+        def generate_content(self, prompt, generation_config=None):
+            return types.SimpleNamespace(text='```json\n{"ok": true}\n```')
+
+    def _no_repair(_text):
+        raise AssertionError("repair_json should not run for well-formed output")
+
+    monkeypatch.setattr(svc, "genai", types.SimpleNamespace(GenerativeModel=FencedLegacyModel))
+    monkeypatch.setattr(svc, "_MODEL_CACHE", {})
+    monkeypatch.setattr(svc, "repair_json", _no_repair)
+
+    assert svc.call_model_with_retry("prompt") == {"ok": True}
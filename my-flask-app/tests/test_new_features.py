@@ -163,6 +163,48 @@ def test_delete_account_requires_confirmation(logged_in_client):
     assert data['error']['code'] == 'INVALID_CONFIRMATION'
 
 
+def test_same_origin_fetch_metadata_skips_origin_parsing(logged_in_client):
+    """Sec-Fetch-Site: same-origin is accepted without an Origin/Referer header."""
+    client, _ = logged_in_client
+    client.post("/api/legal/accept", json={"legal_confirm": True})
+
+    resp = client.post('/api/account/delete',
+                       json={'confirm': 'nope'},
+                       headers={"Sec-Fetch-Site": "same-origin"})
+    assert resp.status_code == 400
+    assert resp.get_json()['error']['code'] == 'INVALID_CONFIRMATION'
+
+    resp = client.post('/api/account/delete',
+                       json={'confirm': 'nope'},
+                       headers={"Sec-Fetch-Site": "cross-site", "Origin": "https://evil.example"})
+    assert resp.status_code == 403
+
+def test_csrf_token_fallback_without_origin(logged_in_client):
+    """Without Origin/Referer, only a matching X-CSRF-Token passes the origin gate."""
+    client, _ = logged_in_client
+    client.post("/api/legal/accept", json={"legal_confirm": True})
+    with client.session_transaction() as sess:
+        sess["csrf_token"] = "b" * 64
+
+    resp = client.post('/api/account/delete', json={'confirm': 'nope'},
+                       headers={"X-CSRF-Token": "b" * 64})
+    assert resp.status_code == 400
+
+    for bad in ("c" * 64, "ב" * 64, "b" * 63):
+        resp = client.post('/api/account/delete', json={'confirm': 'nope'},
+                           headers={"X-CSRF-Token": bad})
+        assert resp.status_code == 403
+
+def test_csrf_token_minted_on_page_render_only(client):
+    client.get("/api/examples")
+    with client.session_transaction() as sess:
+        assert "csrf_token" not in sess
+
+    resp = client.get("/")
+    with client.session_transaction() as sess:
+        token = sess.get("csrf_token")
+    assert token and f'content="{token}"' in resp.get_data(as_text=True)
+
 def test_delete_account_rejects_without_origin(logged_in_client, app, monkeypatch):
     """Test that delete account endpoint rejects requests without Origin/Referer when CANONICAL_BASE is set"""
     client, _ = logged_in_client